@@ -18,7 +18,7 @@ from routes.utils.watch.db import (
     get_watched_artists,
     add_specific_albums_to_artist_table,
     remove_specific_albums_from_artist_table,
-    is_album_in_artist_db,
+    filter_missing_albums,
 )
 from routes.utils.watch.manager import check_watched_artists, get_watch_config
 from routes.utils.get_info import get_spotify_info
@@ -152,11 +152,15 @@ async def get_artist_info(
                 spotify_id
             )  # spotify_id is the artist ID
             if watched_artist_details:  # Artist is being watched
-                for album_item in artist_info["albums"]["items"]:
+                album_items = artist_info["albums"]["items"]
+                missing_album_ids = filter_missing_albums(
+                    spotify_id,
+                    [item["id"] for item in album_items if item and item.get("id")],
+                )
+                for album_item in album_items:
                     if album_item and album_item.get("id"):
-                        album_id = album_item["id"]
-                        album_item["is_locally_known"] = is_album_in_artist_db(
-                            spotify_id, album_id
+                        album_item["is_locally_known"] = (
+                            album_item["id"] not in missing_album_ids
                         )
                     elif album_item:  # Album object exists but no ID
                         album_item["is_locally_known"] = False
@@ -21,7 +21,7 @@ from routes.utils.watch.db import (
     get_watched_playlists,
     add_specific_tracks_to_playlist_table,
     remove_specific_tracks_from_playlist_table,
-    is_track_in_playlist_db,  # Added import
+    filter_missing_tracks,
 )
 from routes.utils.get_info import get_spotify_info  # Already used, but ensure it's here
 from routes.utils.watch.manager import (
@@ -190,11 +190,19 @@ async def get_playlist_info(request: Request, current_user: User = Depends(requi
             watched_playlist_details = get_watched_playlist(playlist_info["id"])
             if watched_playlist_details:  # Playlist is being watched
                 if playlist_info.get("tracks") and playlist_info["tracks"].get("items"):
-                    for item in playlist_info["tracks"]["items"]:
+                    track_items = playlist_info["tracks"]["items"]
+                    missing_track_ids = filter_missing_tracks(
+                        playlist_info["id"],
+                        [
+                            item["track"]["id"]
+                            for item in track_items
+                            if item and item.get("track") and item["track"].get("id")
+                        ],
+                    )
+                    for item in track_items:
                         if item and item.get("track") and item["track"].get("id"):
-                            track_id = item["track"]["id"]
-                            item["track"]["is_locally_known"] = is_track_in_playlist_db(
-                                playlist_info["id"], track_id
+                            item["track"]["is_locally_known"] = (
+                                item["track"]["id"] not in missing_track_ids
                             )
                         elif item and item.get(
                             "track"
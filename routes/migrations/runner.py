@@ -3,6 +3,8 @@ import sqlite3
 from pathlib import Path
 from typing import Optional
 
+from routes.utils.db_schema import columns_from_create_sql
+
 from .v3_2_0 import MigrationV3_2_0
 from .v3_2_1 import log_noop_migration_detected
 
@@ -152,6 +154,24 @@ def _ensure_table_schema(
         )
 
 
+def _tables_missing_columns(
+    conn: sqlite3.Connection, name_pattern: str, expected_columns: dict[str, str]
+) -> list[str]:
+    """Returns tables matching name_pattern whose stored schema lacks an expected column.
+
+    Reads every matching CREATE statement from sqlite_master in one query instead of
+    running PRAGMA table_info per table; ALTER TABLE ADD COLUMN keeps that text current.
+    """
+    cur = conn.execute(
+        "SELECT name, sql FROM sqlite_master WHERE type='table' AND name LIKE ?",
+        (name_pattern,),
+    )
+    expected = set(expected_columns)
+    return [
+        row[0] for row in cur.fetchall() if expected - columns_from_create_sql(row[1])
+    ]
+
+
 def _create_or_update_children_table(conn: sqlite3.Connection, table_name: str) -> None:
     conn.execute(
         f"""
@@ -254,32 +274,10 @@ def _update_watch_playlists_db(conn: sqlite3.Connection) -> None:
             "watched playlists",
         )
 
-        # Upgrade all dynamic playlist_ tables
-        cur = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'playlist_%'"
-        )
-        for row in cur.fetchall():
-            table_name = row[0]
-            conn.execute(
-                f"""
-				CREATE TABLE IF NOT EXISTS {table_name} (
-					spotify_track_id TEXT PRIMARY KEY,
-					title TEXT,
-					artist_names TEXT,
-					album_name TEXT,
-					album_artist_names TEXT,
-					track_number INTEGER,
-					album_spotify_id TEXT,
-					duration_ms INTEGER,
-					added_at_playlist TEXT,
-					added_to_db INTEGER,
-					is_present_in_spotify INTEGER DEFAULT 1,
-					last_seen_in_spotify INTEGER,
-					snapshot_id TEXT,
-					final_path TEXT
-				)
-				"""
-            )
+        # Upgrade dynamic playlist_ tables that are missing columns
+        for table_name in _tables_missing_columns(
+            conn, "playlist_%", EXPECTED_PLAYLIST_TRACKS_COLUMNS
+        ):
             _ensure_table_schema(
                 conn,
                 table_name,
@@ -315,33 +313,10 @@ def _update_watch_artists_db(conn: sqlite3.Connection) -> None:
             conn, "watched_artists", EXPECTED_WATCHED_ARTISTS_COLUMNS, "watched artists"
         )
 
-        # Upgrade all dynamic artist_ tables
-        cur = conn.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'artist_%'"
-        )
-        for row in cur.fetchall():
-            table_name = row[0]
-            conn.execute(
-                f"""
-				CREATE TABLE IF NOT EXISTS {table_name} (
-					album_spotify_id TEXT PRIMARY KEY,
-					artist_spotify_id TEXT,
-					name TEXT,
-					album_group TEXT,
-					album_type TEXT,
-					release_date TEXT,
-					release_date_precision TEXT,
-					total_tracks INTEGER,
-					link TEXT,
-					image_url TEXT,
-					added_to_db INTEGER,
-					last_seen_on_spotify INTEGER,
-					download_task_id TEXT,
-					download_status INTEGER DEFAULT 0,
-					is_fully_downloaded_managed_by_app INTEGER DEFAULT 0
-				)
-				"""
-            )
+        # Upgrade dynamic artist_ tables that are missing columns
+        for table_name in _tables_missing_columns(
+            conn, "artist_%", EXPECTED_ARTIST_ALBUMS_COLUMNS
+        ):
             _ensure_table_schema(
                 conn,
                 table_name,
@@ -265,6 +265,36 @@ class CeleryDownloadQueueManager:
             str | None: Task ID if successfully queued or an error task ID for non-watch duplicates.
                         None if from_watch_job is True and an active duplicate was found.
         """
+        return self.add_tasks([task], from_watch_job=from_watch_job)[0]
+
+    def add_tasks(self, tasks: list, from_watch_job: bool = False) -> list:
+        """
+        Add several download tasks to the Celery queue, with the same semantics as add_task.
+
+        The task snapshot (a full Redis scan) and the config are read once for the whole
+        batch instead of once or twice per task; tasks queued earlier in the batch are
+        added to the snapshot, so they still count as active duplicates.
+
+        Returns:
+            list: One add_task result per input task, in input order.
+        """
+        all_existing_tasks_summary = get_all_tasks()
+        config_params = get_config_params()
+        return [
+            self._add_task(
+                task, from_watch_job, all_existing_tasks_summary, config_params
+            )
+            for task in tasks
+        ]
+
+    def _add_task(
+        self,
+        task: dict,
+        from_watch_job: bool,
+        all_existing_tasks_summary: list,
+        config_params: dict,
+    ):
+        """Queues one task against a pre-fetched task snapshot; see add_task."""
         try:
             # Extract essential parameters for duplicate check
             incoming_url = task.get("url")
@@ -292,7 +322,6 @@ class CeleryDownloadQueueManager:
                 "skipped",
             }
 
-            all_existing_tasks_summary = get_all_tasks()
             if incoming_url:
                 for task_summary in all_existing_tasks_summary:
                     existing_task_id = task_summary.get("task_id")
@@ -363,7 +392,6 @@ class CeleryDownloadQueueManager:
                             return error_task_id  # Return the ID of this new error-state task
 
             task_id = str(uuid.uuid4())
-            config_params = get_config_params()
             original_request = task.get(
                 "orig_request", task.get("original_request", {})
             )
@@ -444,7 +472,7 @@ class CeleryDownloadQueueManager:
                     "name": complete_task["name"],
                     "artist": complete_task["artist"],
                     "retry_count": 0,
-                    "queue_position": len(get_all_tasks()) + 1,
+                    "queue_position": len(all_existing_tasks_summary) + 1,
                 },
             )
 
@@ -462,7 +490,15 @@ class CeleryDownloadQueueManager:
                     countdown=0 if not self.paused else 3600,
                 )
                 logger.info(
-                    f"Added {incoming_type} download task {task_id} to Celery queue."
+                    "Added %s download task %s to Celery queue.", incoming_type, task_id
+                )
+                # Later tasks of the same batch see this one as an active duplicate
+                all_existing_tasks_summary.append(
+                    {
+                        "task_id": task_id,
+                        "task_info": complete_task,
+                        "last_status": {"status": ProgressState.QUEUED},
+                    }
                 )
                 return task_id
             else:
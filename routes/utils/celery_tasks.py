@@ -26,6 +26,7 @@ from routes.utils.celery_config import (
 from routes.utils.watch.db import (
     add_single_track_to_playlist_db,
     add_or_update_album_for_artist,
+    parse_deezspot_callback,
 )
 
 # Import for download history management
@@ -1197,7 +1198,13 @@ class ProgressTrackingTask(Task):
                         f"Task {task_id} was from playlist watch for playlist {playlist_id}. Adding track to DB."
                     )
                     try:
-                        add_single_track_to_playlist_db(playlist_id, track_item_for_db)
+                        # This callback is the metadata source; no need to read it back from Redis
+                        add_single_track_to_playlist_db(
+                            playlist_id,
+                            track_item_for_db,
+                            task_id=task_id,
+                            track_meta=parse_deezspot_callback(data),
+                        )
                     except Exception as db_add_err:
                         logger.error(
                             f"Failed to add track to DB for playlist {playlist_id} after successful download task {task_id}: {db_add_err}",
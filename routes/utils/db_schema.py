@@ -0,0 +1,11 @@
+import re
+
+
+def columns_from_create_sql(create_sql: str) -> set[str]:
+    """Best-effort column names from a CREATE TABLE statement stored in sqlite_master.
+
+    Comments are stripped first; ALTER TABLE ADD COLUMN keeps the stored text current.
+    """
+    body = re.sub(r"/\*.*?\*/", "", create_sql or "", flags=re.DOTALL)
+    body = re.sub(r"--[^\n]*", "", body)
+    return set(re.findall(r'[(,]\s*["`\[]?(\w+)', body))
@@ -1,8 +1,17 @@
+import atexit
+import json
+import os
 import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 import logging
 import time
 
+from routes.utils.db_schema import columns_from_create_sql
+
 logger = logging.getLogger(__name__)
 
 DB_DIR = Path("./data/watch")
@@ -30,8 +39,12 @@ EXPECTED_WATCHED_PLAYLISTS_COLUMNS = {
     "batch_processing_snapshot_id": "TEXT",
 }
 
+# Tracks of all watched playlists live in one table, keyed by (playlist_spotify_id, spotify_track_id)
+PLAYLIST_TRACKS_TABLE = "playlist_tracks"
+
 EXPECTED_PLAYLIST_TRACKS_COLUMNS = {
-    "spotify_track_id": "TEXT PRIMARY KEY",
+    "playlist_spotify_id": "TEXT NOT NULL",  # Part of the composite PRIMARY KEY
+    "spotify_track_id": "TEXT NOT NULL",  # Part of the composite PRIMARY KEY
     "title": "TEXT",
     "artist_names": "TEXT",
     "album_name": "TEXT",
@@ -62,9 +75,12 @@ EXPECTED_WATCHED_ARTISTS_COLUMNS = {
     "batch_next_offset": "INTEGER DEFAULT 0",
 }
 
+# Albums of all watched artists live in one table, keyed by (artist_spotify_id, album_spotify_id)
+ARTIST_ALBUMS_TABLE = "artist_albums"
+
 EXPECTED_ARTIST_ALBUMS_COLUMNS = {
-    "album_spotify_id": "TEXT PRIMARY KEY",
-    "artist_spotify_id": "TEXT",  # Foreign key to watched_artists
+    "artist_spotify_id": "TEXT NOT NULL",  # Part of the composite PRIMARY KEY
+    "album_spotify_id": "TEXT NOT NULL",  # Part of the composite PRIMARY KEY
     "name": "TEXT",
     "album_group": "TEXT",  # album, single, compilation, appears_on
     "album_type": "TEXT",  # album, single, compilation
@@ -80,6 +96,14 @@ EXPECTED_ARTIST_ALBUMS_COLUMNS = {
     "is_fully_downloaded_managed_by_app": "INTEGER DEFAULT 0",  # 0: No, 1: Yes (app has marked all its tracks as downloaded)
 }
 
+# download_status for add_or_update_album_for_artist, keyed by (has task_id, is_download_complete)
+_DOWNLOAD_STATUS_BY_FLAGS = {
+    (False, False): 0,  # Not Queued
+    (True, False): 1,  # Queued/In Progress
+    (False, True): 2,  # Downloaded
+    (True, True): 2,  # Downloaded
+}
+
 
 def _ensure_table_schema(
     cursor: sqlite3.Cursor,
@@ -91,9 +115,19 @@ def _ensure_table_schema(
     Ensures the given table has all expected columns, adding them if necessary.
     """
     try:
+        # Fast path: the stored CREATE statement (kept current by ALTER TABLE ADD COLUMN)
+        # already names every expected column, so there is nothing to migrate.
+        cursor.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name = ?",
+            (table_name,),
+        )
+        row = cursor.fetchone()
+        if row and not set(expected_columns) - columns_from_create_sql(row["sql"]):
+            return False
+
         cursor.execute(f"PRAGMA table_info({table_name})")
         existing_columns_info = cursor.fetchall()
-        existing_column_names = {col[1] for col in existing_columns_info}
+        existing_column_names = {col["name"] for col in existing_columns_info}
 
         added_columns_to_this_table = False
         for col_name, col_type in expected_columns.items():
@@ -131,25 +165,333 @@ def _ensure_table_schema(
         return False
 
 
-def _get_playlists_db_connection():
-    DB_DIR.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(PLAYLISTS_DB_PATH, timeout=10)
-    conn.row_factory = sqlite3.Row
-    return conn
+# Statement cache size for the long-lived pooled connections. sqlite3 keys its cache on
+# the exact SQL text, so hot-path statements below are built once and reused verbatim.
+_STATEMENT_CACHE_SIZE = 256
+# Page cache per connection, in KiB (negative cache_size)
+_CACHE_SIZE_KIB = 16000
+# Bytes of the database file read through a memory map instead of read() calls
+_MMAP_SIZE_BYTES = 256 * 1024 * 1024
+
+
+def _dict_row(cursor: sqlite3.Cursor, row: tuple) -> dict:
+    """Row factory building plain dicts, so readers skip the sqlite3.Row -> dict copy."""
+    return {col[0]: value for col, value in zip(cursor.description, row)}
+
+
+def _apply_connection_pragmas(conn: sqlite3.Connection) -> None:
+    """Per-connection settings shared by the writer and the readers."""
+    conn.execute(f"PRAGMA cache_size=-{_CACHE_SIZE_KIB}")
+    conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE_BYTES}")
+    # Sorts and temp b-trees for GROUP BY / IN (SELECT ...) stay off disk
+    conn.execute("PRAGMA temp_store=MEMORY")
+
+
+def _fetch_all_dicts(cursor: sqlite3.Cursor) -> list[dict]:
+    """Like fetchall() under _dict_row, but reads the column names once for the whole result."""
+    cursor.row_factory = None
+    columns = [col[0] for col in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor]
+
+
+class SqlitePool:
+    """
+    Long-lived connections to one SQLite database: a single read-write connection shared
+    by all threads (serialized by a lock, as SQLite allows one writer anyway) and one
+    read-only connection per thread. In WAL mode readers are never blocked by the writer.
+
+    Connections are configured once when opened and reopened after a fork, since Celery's
+    prefork workers import this module before forking.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._writer_lock = threading.RLock()
+        self._writer: sqlite3.Connection | None = None
+        self._writer_pid: int | None = None
+        # Nesting depth of write() on the thread holding the writer lock
+        self._write_depth = 0
+        self._readers = threading.local()
+
+    def _writer_conn(self) -> sqlite3.Connection:
+        with self._writer_lock:
+            # Connections must not be shared with forked worker processes
+            if self._writer is None or self._writer_pid != os.getpid():
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(
+                    f"file:{self.path.as_posix()}?mode=rwc",
+                    uri=True,
+                    timeout=10,
+                    isolation_level="IMMEDIATE",
+                    check_same_thread=False,
+                    cached_statements=_STATEMENT_CACHE_SIZE,
+                )
+                conn.row_factory = sqlite3.Row
+                conn.execute("PRAGMA journal_mode=WAL")
+                # NORMAL is durable across application crashes in WAL mode and skips
+                # the fsync on every commit
+                conn.execute("PRAGMA synchronous=NORMAL")
+                _apply_connection_pragmas(conn)
+                self._writer = conn
+                self._writer_pid = os.getpid()
+                self._write_depth = 0
+            return self._writer
+
+    def _reader_conn(self) -> sqlite3.Connection:
+        readers = self._readers
+        conn = getattr(readers, "conn", None)
+        if conn is None or getattr(readers, "pid", None) != os.getpid():
+            # The writer creates the file and switches it to WAL before the first read
+            self._writer_conn()
+            conn = sqlite3.connect(
+                f"file:{self.path.as_posix()}?mode=ro",
+                uri=True,
+                timeout=10,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
+            conn.row_factory = _dict_row
+            _apply_connection_pragmas(conn)
+            readers.conn = conn
+            readers.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def read(self):
+        """Yields this thread's read-only connection; rows are plain dicts."""
+        yield self._reader_conn()
+
+    @contextmanager
+    def write(self):
+        """Holds the writer for the duration of the block; commits on success, rolls back on error.
+
+        Nested blocks join the outermost one, so the whole batch is committed once.
+        """
+        with self._writer_lock:
+            conn = self._writer_conn()
+            if self._write_depth:
+                yield conn
+                return
+            self._write_depth += 1
+            try:
+                with conn:
+                    yield conn
+            finally:
+                self._write_depth -= 1
+
+    def close(self) -> None:
+        """Refreshes planner statistics and closes the writer."""
+        with self._writer_lock:
+            conn = self._writer
+            if conn is None or self._writer_pid != os.getpid():
+                return
+            try:
+                conn.execute("PRAGMA optimize")
+                conn.close()
+            except sqlite3.Error as e:
+                logger.warning(f"Error closing {self.path}: {e}")
+            self._writer = None
+
+
+_playlists_pool = SqlitePool(PLAYLISTS_DB_PATH)
+_artists_pool = SqlitePool(ARTISTS_DB_PATH)
+atexit.register(_playlists_pool.close)
+atexit.register(_artists_pool.close)
+
+
+def _playlists_read_connection():
+    return _playlists_pool.read()
+
+
+def _playlists_write_connection():
+    return _playlists_pool.write()
+
+
+def _artists_read_connection():
+    return _artists_pool.read()
 
 
 def _get_artists_db_connection():
-    DB_DIR.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(ARTISTS_DB_PATH, timeout=10)
-    conn.row_factory = sqlite3.Row
-    return conn
+    return _artists_pool.write()
+
+
+def _begin_immediate(conn: sqlite3.Connection) -> None:
+    """Opens a write transaction unless one is already active (e.g. an enclosing batch)."""
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE")
+
+
+def playlists_write_transaction():
+    """
+    Groups several playlist DB writes into a single transaction (one commit/fsync).
+    Write helpers called inside the block join it instead of committing on their own.
+    """
+    return _playlists_write_connection()
+
+
+def artists_write_transaction():
+    """Same as playlists_write_transaction, for artists.db."""
+    return _get_artists_db_connection()
+
+
+_SQL_SELECT_PRESENT_TRACK_IDS = (
+    f"SELECT spotify_track_id FROM {PLAYLIST_TRACKS_TABLE} "
+    "WHERE playlist_spotify_id = ? AND is_present_in_spotify = 1"
+)
+_SQL_SELECT_OUTDATED_TRACK_IDS = (
+    f"SELECT spotify_track_id FROM {PLAYLIST_TRACKS_TABLE} "
+    "WHERE playlist_spotify_id = ? AND is_present_in_spotify = 1 AND snapshot_id IS NOT ?"
+)
+_SQL_COUNT_PRESENT_TRACKS = (
+    f"SELECT COUNT(*) as count FROM {PLAYLIST_TRACKS_TABLE} "
+    "WHERE playlist_spotify_id = ? AND is_present_in_spotify = 1"
+)
+_SQL_TRACK_EXISTS = (
+    f"SELECT 1 FROM {PLAYLIST_TRACKS_TABLE} "
+    "WHERE playlist_spotify_id = ? AND spotify_track_id = ?"
+)
+_SQL_SELECT_KNOWN_TRACK_IDS = (
+    f"SELECT spotify_track_id FROM {PLAYLIST_TRACKS_TABLE} "
+    "WHERE playlist_spotify_id = ? AND spotify_track_id IN (SELECT value FROM json_each(?))"
+)
+_SQL_SELECT_PRESENT_TRACK_IDS_AMONG = (
+    f"SELECT spotify_track_id FROM {PLAYLIST_TRACKS_TABLE} "
+    "WHERE playlist_spotify_id = ? AND is_present_in_spotify = 1 "
+    "AND spotify_track_id IN (SELECT value FROM json_each(?))"
+)
+# The fields in SET must match the order of ?s, excluding the last two for WHERE.
+_SQL_UPDATE_TRACK_FROM_API = f"""
+    UPDATE {PLAYLIST_TRACKS_TABLE} SET
+        title = ?,
+        artist_names = ?,
+        album_name = ?,
+        album_artist_names = ?,
+        track_number = ?,
+        album_spotify_id = ?,
+        duration_ms = ?,
+        added_at_playlist = ?,
+        is_present_in_spotify = ?,
+        last_seen_in_spotify = ?,
+        snapshot_id = ?
+    WHERE playlist_spotify_id = ? AND spotify_track_id = ?
+"""
+# Updates rows in place on re-add, keeping added_to_db, snapshot_id and final_path
+_SQL_UPSERT_MANUAL_TRACK = f"""
+    INSERT INTO {PLAYLIST_TRACKS_TABLE}
+    (playlist_spotify_id, spotify_track_id, title, artist_names, album_name, album_artist_names, track_number, album_spotify_id, duration_ms, added_at_playlist, added_to_db, is_present_in_spotify, last_seen_in_spotify)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(playlist_spotify_id, spotify_track_id) DO UPDATE SET
+        title = excluded.title,
+        artist_names = excluded.artist_names,
+        album_name = excluded.album_name,
+        album_artist_names = excluded.album_artist_names,
+        track_number = excluded.track_number,
+        album_spotify_id = excluded.album_spotify_id,
+        duration_ms = excluded.duration_ms,
+        is_present_in_spotify = excluded.is_present_in_spotify,
+        last_seen_in_spotify = excluded.last_seen_in_spotify
+"""
+# Same in-place update for finished downloads; only added_to_db keeps its first value
+_SQL_UPSERT_DOWNLOADED_TRACK = f"""
+    INSERT INTO {PLAYLIST_TRACKS_TABLE}
+    (playlist_spotify_id, spotify_track_id, title, artist_names, album_name, album_artist_names, track_number, album_spotify_id, duration_ms, added_at_playlist, added_to_db, is_present_in_spotify, last_seen_in_spotify, snapshot_id, final_path)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(playlist_spotify_id, spotify_track_id) DO UPDATE SET
+        title = excluded.title,
+        artist_names = excluded.artist_names,
+        album_name = excluded.album_name,
+        album_artist_names = excluded.album_artist_names,
+        track_number = excluded.track_number,
+        album_spotify_id = excluded.album_spotify_id,
+        duration_ms = excluded.duration_ms,
+        added_at_playlist = excluded.added_at_playlist,
+        is_present_in_spotify = excluded.is_present_in_spotify,
+        last_seen_in_spotify = excluded.last_seen_in_spotify,
+        snapshot_id = excluded.snapshot_id,
+        final_path = excluded.final_path
+"""
+
+
+# Id lists are bound as a single JSON array and expanded with json_each, so the statement
+# text is constant (one cached plan) and no SQLITE_MAX_VARIABLE_NUMBER limit applies.
+# The planner walks the list once and seeks the primary key per id, so callers need not
+# chunk large lists.
+_SQL_MARK_TRACKS_NOT_PRESENT = (
+    f"UPDATE {PLAYLIST_TRACKS_TABLE} SET is_present_in_spotify = 0 "
+    "WHERE playlist_spotify_id = ? AND spotify_track_id IN (SELECT value FROM json_each(?))"
+)
+_SQL_DELETE_TRACKS = (
+    f"DELETE FROM {PLAYLIST_TRACKS_TABLE} "
+    "WHERE playlist_spotify_id = ? AND spotify_track_id IN (SELECT value FROM json_each(?))"
+)
+_SQL_DELETE_PLAYLIST_TRACKS = (
+    f"DELETE FROM {PLAYLIST_TRACKS_TABLE} WHERE playlist_spotify_id = ?"
+)
+
+
+_SQL_SELECT_ARTIST_ALBUM_IDS = (
+    f"SELECT album_spotify_id FROM {ARTIST_ALBUMS_TABLE} WHERE artist_spotify_id = ?"
+)
+_SQL_ARTIST_ALBUM_EXISTS = (
+    f"SELECT 1 FROM {ARTIST_ALBUMS_TABLE} "
+    "WHERE artist_spotify_id = ? AND album_spotify_id = ?"
+)
+_SQL_SELECT_KNOWN_ALBUM_IDS = (
+    f"SELECT album_spotify_id FROM {ARTIST_ALBUMS_TABLE} "
+    "WHERE artist_spotify_id = ? AND album_spotify_id IN (SELECT value FROM json_each(?))"
+)
+_SQL_DELETE_ARTIST_ALBUMS = (
+    f"DELETE FROM {ARTIST_ALBUMS_TABLE} "
+    "WHERE artist_spotify_id = ? AND album_spotify_id IN (SELECT value FROM json_each(?))"
+)
+_SQL_DELETE_ALL_ARTIST_ALBUMS = (
+    f"DELETE FROM {ARTIST_ALBUMS_TABLE} WHERE artist_spotify_id = ?"
+)
+# An existing row keeps added_to_db and is_fully_downloaded_managed_by_app
+_SQL_UPSERT_ARTIST_ALBUM = f"""
+    INSERT INTO {ARTIST_ALBUMS_TABLE} (
+        artist_spotify_id,
+        album_spotify_id,
+        name,
+        album_group,
+        album_type,
+        release_date,
+        release_date_precision,
+        total_tracks,
+        link,
+        image_url,
+        added_to_db,
+        last_seen_on_spotify,
+        download_task_id,
+        download_status,
+        is_fully_downloaded_managed_by_app
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ON CONFLICT(artist_spotify_id, album_spotify_id) DO UPDATE SET
+        name = excluded.name,
+        album_group = excluded.album_group,
+        album_type = excluded.album_type,
+        release_date = excluded.release_date,
+        release_date_precision = excluded.release_date_precision,
+        total_tracks = excluded.total_tracks,
+        link = excluded.link,
+        image_url = excluded.image_url,
+        last_seen_on_spotify = excluded.last_seen_on_spotify,
+        download_status = excluded.download_status,
+        download_task_id = excluded.download_task_id
+"""
+_SQL_UPDATE_ALBUM_DOWNLOAD_STATUS = f"""
+    UPDATE {ARTIST_ALBUMS_TABLE}
+    SET download_status = ?, download_task_id = ?, last_seen_on_spotify = ?
+    WHERE artist_spotify_id = ? AND album_spotify_id = ?
+"""
 
 
 def init_playlists_db():
     """Initializes the playlists database and creates/updates the main watched_playlists table."""
     try:
-        with _get_playlists_db_connection() as conn:
+        with _playlists_write_connection() as conn:
             cursor = conn.cursor()
+            # DDL does not open a transaction implicitly; run the whole schema sync in one
+            _begin_immediate(conn)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS watched_playlists (
                     spotify_id TEXT PRIMARY KEY,
@@ -165,17 +507,20 @@ def init_playlists_db():
                 )
             """)
             # Ensure schema
-            if _ensure_table_schema(
+            _ensure_table_schema(
                 cursor,
                 "watched_playlists",
                 EXPECTED_WATCHED_PLAYLISTS_COLUMNS,
                 "watched playlists",
-            ):
-                conn.commit()
+            )
+            # Partial index: the watch loop only ever lists active playlists
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_watched_playlists_active "
+                "ON watched_playlists(spotify_id) WHERE is_active = 1"
+            )
 
             # Update all existing playlist track tables with new schema
             _update_all_playlist_track_tables(cursor)
-            conn.commit()
 
             logger.info(
                 f"Playlists database initialized/updated successfully at {PLAYLISTS_DB_PATH}"
@@ -186,35 +531,131 @@ def init_playlists_db():
 
 
 def _update_all_playlist_track_tables(cursor: sqlite3.Cursor):
-    """Updates all existing playlist track tables to ensure they have the latest schema."""
+    """Ensures the shared playlist_tracks table exists with the latest schema and folds any
+    legacy per-playlist tables (playlist_<id>) into it."""
     try:
-        # Get all table names that start with 'playlist_'
-        cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'playlist_%'"
-        )
-        playlist_tables = cursor.fetchall()
-
-        for table_row in playlist_tables:
-            table_name = table_row[0]
-            if _ensure_table_schema(
-                cursor,
-                table_name,
-                EXPECTED_PLAYLIST_TRACKS_COLUMNS,
-                f"playlist tracks ({table_name})",
-            ):
-                logger.info(
-                    f"Updated schema for existing playlist track table: {table_name}"
-                )
-
+        _create_playlist_tracks_table(cursor)
+        if _ensure_table_schema(
+            cursor,
+            PLAYLIST_TRACKS_TABLE,
+            EXPECTED_PLAYLIST_TRACKS_COLUMNS,
+            "playlist tracks",
+        ):
+            logger.info(f"Updated schema for {PLAYLIST_TRACKS_TABLE} table")
+        _create_playlist_tracks_indexes(cursor)
+        _migrate_legacy_playlist_track_tables(cursor)
     except sqlite3.Error as e:
         logger.error(f"Error updating playlist track tables schema: {e}", exc_info=True)
 
 
+def _create_playlist_tracks_table(cursor: sqlite3.Cursor):
+    """Creates the table holding the tracks of every watched playlist in playlists.db."""
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {PLAYLIST_TRACKS_TABLE} (
+            playlist_spotify_id TEXT NOT NULL,
+            spotify_track_id TEXT NOT NULL,
+            title TEXT,
+            artist_names TEXT, -- Comma-separated artist names
+            album_name TEXT,
+            album_artist_names TEXT, -- Comma-separated album artist names
+            track_number INTEGER,
+            album_spotify_id TEXT,
+            duration_ms INTEGER,
+            added_at_playlist TEXT, -- When track was added to Spotify playlist
+            added_to_db INTEGER, -- Timestamp when track was added to this DB table
+            is_present_in_spotify INTEGER DEFAULT 1, -- Flag to mark if still in Spotify playlist
+            last_seen_in_spotify INTEGER, -- Timestamp when last confirmed in Spotify playlist
+            snapshot_id TEXT, -- Track the snapshot_id when this track was added/updated
+            final_path TEXT, -- Absolute path of the downloaded file from deezspot callback
+            PRIMARY KEY (playlist_spotify_id, spotify_track_id)
+        ) WITHOUT ROWID
+    """)
+
+
+_PLAYLIST_TRACKS_PRESENT_INDEX_COLUMNS = [
+    "playlist_spotify_id",
+    "is_present_in_spotify",
+    "snapshot_id",
+]
+
+
+def _create_playlist_tracks_indexes(cursor: sqlite3.Cursor):
+    """Creates the covering index used by the 'is_present_in_spotify = 1' reads.
+
+    (playlist_spotify_id, is_present_in_spotify, snapshot_id) answers the track-ID listing, the
+    present-track count and the outdated-track lookup without touching the table rows: the table
+    is WITHOUT ROWID, so its primary key (and with it spotify_track_id) ends every index entry.
+    """
+    index_name = f"idx_{PLAYLIST_TRACKS_TABLE}_present"
+    # Rebuild an index created with an older column list (it also carried the title)
+    cursor.execute(f"PRAGMA index_info({index_name})")
+    indexed_columns = [row[2] for row in cursor.fetchall()]
+    if indexed_columns and indexed_columns != _PLAYLIST_TRACKS_PRESENT_INDEX_COLUMNS:
+        cursor.execute(f"DROP INDEX {index_name}")
+    cursor.execute(
+        f"CREATE INDEX IF NOT EXISTS {index_name} "
+        f"ON {PLAYLIST_TRACKS_TABLE}({', '.join(_PLAYLIST_TRACKS_PRESENT_INDEX_COLUMNS)})"
+    )
+
+
+def _migrate_legacy_playlist_track_tables(cursor: sqlite3.Cursor):
+    """Copies rows from legacy playlist_<id> tables into playlist_tracks and drops them.
+
+    Each legacy table is moved under its own savepoint, so a failure leaves that table in place
+    to be retried on the next start without undoing the rest of the migration.
+    """
+    cursor.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'playlist_%' AND name != ?",
+        (PLAYLIST_TRACKS_TABLE,),
+    )
+    legacy_tables = [row[0] for row in cursor.fetchall()]
+    if not legacy_tables:
+        return
+
+    # Table names were derived from the playlist ID; map them back via the watchlist
+    cursor.execute("SELECT spotify_id FROM watched_playlists")
+    playlist_id_by_table = {
+        f"playlist_{row[0].replace('-', '_')}": row[0] for row in cursor.fetchall()
+    }
+    target_columns = set(EXPECTED_PLAYLIST_TRACKS_COLUMNS) - {"playlist_spotify_id"}
+
+    for table_name in legacy_tables:
+        playlist_spotify_id = playlist_id_by_table.get(
+            table_name, table_name[len("playlist_") :]
+        )
+        cursor.execute("SAVEPOINT migrate_legacy_playlist")
+        try:
+            cursor.execute(f'PRAGMA table_info("{table_name}")')
+            columns = [row[1] for row in cursor.fetchall() if row[1] in target_columns]
+            if "spotify_track_id" in columns:
+                column_list = ", ".join(columns)
+                cursor.execute(
+                    f"""
+                    INSERT OR IGNORE INTO {PLAYLIST_TRACKS_TABLE} (playlist_spotify_id, {column_list})
+                    SELECT ?, {column_list} FROM "{table_name}"
+                """,
+                    (playlist_spotify_id,),
+                )
+            cursor.execute(f'DROP TABLE "{table_name}"')
+            cursor.execute("RELEASE migrate_legacy_playlist")
+            logger.info(
+                f"Migrated legacy playlist table '{table_name}' into {PLAYLIST_TRACKS_TABLE}."
+            )
+        except sqlite3.Error as e:
+            cursor.execute("ROLLBACK TO migrate_legacy_playlist")
+            cursor.execute("RELEASE migrate_legacy_playlist")
+            logger.error(
+                f"Error migrating legacy playlist table '{table_name}': {e}",
+                exc_info=True,
+            )
+
+
 def update_all_existing_tables_schema():
     """Updates all existing tables to ensure they have the latest schema. Can be called independently."""
     try:
-        with _get_playlists_db_connection() as conn:
+        with _playlists_write_connection() as conn:
             cursor = conn.cursor()
+            _begin_immediate(conn)
 
             # Update main watched_playlists table
             if _ensure_table_schema(
@@ -225,10 +666,9 @@ def update_all_existing_tables_schema():
             ):
                 logger.info("Updated schema for watched_playlists table")
 
-            # Update all playlist track tables
+            # Update the playlist tracks table
             _update_all_playlist_track_tables(cursor)
 
-            conn.commit()
             logger.info(
                 "Successfully updated all existing tables schema in playlists database"
             )
@@ -239,37 +679,19 @@ def update_all_existing_tables_schema():
 
 
 def ensure_playlist_table_schema(playlist_spotify_id: str):
-    """Ensures a specific playlist's track table has the latest schema."""
-    table_name = f"playlist_{playlist_spotify_id.replace('-', '_')}"
+    """Ensures the playlist tracks table used by this playlist has the latest schema."""
     try:
-        with _get_playlists_db_connection() as conn:
-            cursor = conn.cursor()
-
-            # Check if table exists
-            cursor.execute(
-                f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}';"
-            )
-            if cursor.fetchone() is None:
-                logger.warning(
-                    f"Table {table_name} does not exist. Cannot update schema."
-                )
-                return False
-
-            # Update schema
+        with _playlists_write_connection() as conn:
             if _ensure_table_schema(
-                cursor,
-                table_name,
+                conn.cursor(),
+                PLAYLIST_TRACKS_TABLE,
                 EXPECTED_PLAYLIST_TRACKS_COLUMNS,
-                f"playlist tracks ({playlist_spotify_id})",
+                "playlist tracks",
             ):
-                conn.commit()
-                logger.info(f"Updated schema for playlist track table: {table_name}")
-                return True
-            else:
                 logger.info(
-                    f"Schema already up-to-date for playlist track table: {table_name}"
+                    f"Updated schema for {PLAYLIST_TRACKS_TABLE} table (playlist {playlist_spotify_id})"
                 )
-                return True
+            return True
 
     except sqlite3.Error as e:
         logger.error(
@@ -279,59 +701,14 @@ def ensure_playlist_table_schema(playlist_spotify_id: str):
         return False
 
 
-def _create_playlist_tracks_table(playlist_spotify_id: str):
-    """Creates or updates a table for a specific playlist to store its tracks in playlists.db."""
-    table_name = f"playlist_{playlist_spotify_id.replace('-', '_').replace(' ', '_')}"  # Sanitize table name
-    try:
-        with _get_playlists_db_connection() as conn:  # Use playlists connection
-            cursor = conn.cursor()
-            cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS {table_name} (
-                    spotify_track_id TEXT PRIMARY KEY,
-                    title TEXT,
-                    artist_names TEXT, -- Comma-separated artist names
-                    album_name TEXT,
-                    album_artist_names TEXT, -- Comma-separated album artist names
-                    track_number INTEGER,
-                    album_spotify_id TEXT,
-                    duration_ms INTEGER,
-                    added_at_playlist TEXT, -- When track was added to Spotify playlist
-                    added_to_db INTEGER, -- Timestamp when track was added to this DB table
-                    is_present_in_spotify INTEGER DEFAULT 1, -- Flag to mark if still in Spotify playlist
-                    last_seen_in_spotify INTEGER, -- Timestamp when last confirmed in Spotify playlist
-                    snapshot_id TEXT -- Track the snapshot_id when this track was added/updated
-                )
-            """)
-            # Ensure schema
-            if _ensure_table_schema(
-                cursor,
-                table_name,
-                EXPECTED_PLAYLIST_TRACKS_COLUMNS,
-                f"playlist tracks ({playlist_spotify_id})",
-            ):
-                conn.commit()
-            logger.info(
-                f"Tracks table '{table_name}' created/updated or already exists in {PLAYLISTS_DB_PATH}."
-            )
-    except sqlite3.Error as e:
-        logger.error(
-            f"Error creating playlist tracks table {table_name} in {PLAYLISTS_DB_PATH}: {e}",
-            exc_info=True,
-        )
-        raise
-
-
 def add_playlist_to_watch(playlist_data: dict):
-    """Adds a playlist to the watched_playlists table and creates its tracks table in playlists.db."""
+    """Adds a playlist to the watched_playlists table in playlists.db."""
     try:
-        _create_playlist_tracks_table(playlist_data["id"])
-
         # Construct Spotify URL manually since external_urls might not be present in metadata
         spotify_url = f"https://open.spotify.com/playlist/{playlist_data['id']}"
 
-        with _get_playlists_db_connection() as conn:  # Use playlists connection
-            cursor = conn.cursor()
-            cursor.execute(
+        with _playlists_write_connection() as conn:
+            conn.execute(
                 """
                 INSERT OR REPLACE INTO watched_playlists
                 (spotify_id, name, owner_id, owner_name, total_tracks, link, snapshot_id, last_checked, added_at, is_active)
@@ -351,7 +728,6 @@ def add_playlist_to_watch(playlist_data: dict):
                     int(time.time()),
                 ),
             )
-            conn.commit()
             logger.info(
                 f"Playlist '{playlist_data['name']}' ({playlist_data['id']}) added to watchlist in {PLAYLISTS_DB_PATH}."
             )
@@ -364,19 +740,16 @@ def add_playlist_to_watch(playlist_data: dict):
 
 
 def remove_playlist_from_watch(playlist_spotify_id: str):
-    """Removes a playlist from watched_playlists and drops its tracks table in playlists.db."""
-    table_name = f"playlist_{playlist_spotify_id.replace('-', '_')}"
+    """Removes a playlist from watched_playlists and deletes its tracks in playlists.db."""
     try:
-        with _get_playlists_db_connection() as conn:  # Use playlists connection
-            cursor = conn.cursor()
-            cursor.execute(
+        with _playlists_write_connection() as conn:
+            cursor = conn.execute(
                 "DELETE FROM watched_playlists WHERE spotify_id = ?",
                 (playlist_spotify_id,),
             )
-            cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-            conn.commit()
+            cursor.execute(_SQL_DELETE_PLAYLIST_TRACKS, (playlist_spotify_id,))
             logger.info(
-                f"Playlist {playlist_spotify_id} removed from watchlist and its table '{table_name}' dropped in {PLAYLISTS_DB_PATH}."
+                f"Playlist {playlist_spotify_id} removed from watchlist and its tracks deleted in {PLAYLISTS_DB_PATH}."
             )
     except sqlite3.Error as e:
         logger.error(
@@ -389,11 +762,12 @@ def remove_playlist_from_watch(playlist_spotify_id: str):
 def get_watched_playlists():
     """Retrieves all active playlists from the watched_playlists table in playlists.db."""
     try:
-        with _get_playlists_db_connection() as conn:  # Use playlists connection
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM watched_playlists WHERE is_active = 1")
-            playlists = [dict(row) for row in cursor.fetchall()]
-            return playlists
+        with _playlists_read_connection() as conn:
+            # Explicit rowid order: the partial index would otherwise return them by ID
+            cursor = conn.execute(
+                "SELECT * FROM watched_playlists WHERE is_active = 1 ORDER BY rowid"
+            )
+            return _fetch_all_dicts(cursor)
     except sqlite3.Error as e:
         logger.error(
             f"Error retrieving watched playlists from {PLAYLISTS_DB_PATH}: {e}",
@@ -402,17 +776,33 @@ def get_watched_playlists():
         return []
 
 
+def get_watched_playlist_ids() -> list[str]:
+    """Retrieves the Spotify IDs of all active watched playlists (no row materialization)."""
+    try:
+        with _playlists_read_connection() as conn:
+            # Same insertion order as get_watched_playlists, which the scheduler relies on
+            cursor = conn.execute(
+                "SELECT spotify_id FROM watched_playlists WHERE is_active = 1 ORDER BY rowid"
+            )
+            cursor.row_factory = None
+            return [row[0] for row in cursor]
+    except sqlite3.Error as e:
+        logger.error(
+            f"Error retrieving watched playlist IDs from {PLAYLISTS_DB_PATH}: {e}",
+            exc_info=True,
+        )
+        return []
+
+
 def get_watched_playlist(playlist_spotify_id: str):
     """Retrieves a specific playlist from the watched_playlists table in playlists.db."""
     try:
-        with _get_playlists_db_connection() as conn:  # Use playlists connection
-            cursor = conn.cursor()
-            cursor.execute(
+        with _playlists_read_connection() as conn:
+            cursor = conn.execute(
                 "SELECT * FROM watched_playlists WHERE spotify_id = ?",
                 (playlist_spotify_id,),
             )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            return cursor.fetchone()
     except sqlite3.Error as e:
         logger.error(
             f"Error retrieving playlist {playlist_spotify_id} from {PLAYLISTS_DB_PATH}: {e}",
@@ -426,9 +816,8 @@ def update_playlist_snapshot(
 ):
     """Updates the snapshot_id and total_tracks for a watched playlist in playlists.db."""
     try:
-        with _get_playlists_db_connection() as conn:  # Use playlists connection
-            cursor = conn.cursor()
-            cursor.execute(
+        with _playlists_write_connection() as conn:
+            conn.execute(
                 """
                 UPDATE watched_playlists
                 SET snapshot_id = ?, total_tracks = ?, last_checked = ?
@@ -436,7 +825,6 @@ def update_playlist_snapshot(
             """,
                 (snapshot_id, total_tracks, int(time.time()), playlist_spotify_id),
             )
-            conn.commit()
     except sqlite3.Error as e:
         logger.error(
             f"Error updating snapshot for playlist {playlist_spotify_id} in {PLAYLISTS_DB_PATH}: {e}",
@@ -450,9 +838,8 @@ def update_playlist_snapshot(
 def get_playlist_batch_progress(playlist_spotify_id: str) -> tuple[int, str | None]:
     """Returns (batch_next_offset, batch_processing_snapshot_id) for a watched playlist."""
     try:
-        with _get_playlists_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        with _playlists_read_connection() as conn:
+            cursor = conn.execute(
                 "SELECT batch_next_offset, batch_processing_snapshot_id FROM watched_playlists WHERE spotify_id = ?",
                 (playlist_spotify_id,),
             )
@@ -481,9 +868,8 @@ def set_playlist_batch_progress(
 ) -> None:
     """Updates batch_next_offset and batch_processing_snapshot_id for a watched playlist."""
     try:
-        with _get_playlists_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        with _playlists_write_connection() as conn:
+            conn.execute(
                 """
                 UPDATE watched_playlists
                 SET batch_next_offset = ?, batch_processing_snapshot_id = ?
@@ -491,7 +877,6 @@ def set_playlist_batch_progress(
                 """,
                 (int(next_offset or 0), processing_snapshot_id, playlist_spotify_id),
             )
-            conn.commit()
     except sqlite3.Error as e:
         logger.error(
             f"Error updating batch progress for playlist {playlist_spotify_id}: {e}",
@@ -500,112 +885,70 @@ def set_playlist_batch_progress(
 
 
 def get_playlist_track_ids_from_db(playlist_spotify_id: str):
-    """Retrieves all track Spotify IDs from a specific playlist's tracks table in playlists.db."""
-    table_name = f"playlist_{playlist_spotify_id.replace('-', '_')}"
+    """Retrieves all track Spotify IDs of a specific playlist from playlists.db."""
     track_ids: set[str] = set()
     try:
-        with _get_playlists_db_connection() as conn:  # Use playlists connection
+        with _playlists_read_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}';"
-            )
-            if cursor.fetchone() is None:
-                logger.warning(
-                    f"Track table {table_name} does not exist in {PLAYLISTS_DB_PATH}. Cannot fetch track IDs."
-                )
-                return track_ids
-            cursor.execute(
-                f"SELECT spotify_track_id FROM {table_name} WHERE is_present_in_spotify = 1"
-            )
-            rows = cursor.fetchall()
-            for row in rows:
-                track_ids.add(row["spotify_track_id"])
+            cursor.row_factory = None  # plain tuples; only the first column is read
+            cursor.execute(_SQL_SELECT_PRESENT_TRACK_IDS, (playlist_spotify_id,))
+            # Consume the cursor directly instead of materializing all rows first
+            track_ids = {row[0] for row in cursor}
         return track_ids
     except sqlite3.Error as e:
         logger.error(
-            f"Error retrieving track IDs for playlist {playlist_spotify_id} from table {table_name} in {PLAYLISTS_DB_PATH}: {e}",
+            f"Error retrieving track IDs for playlist {playlist_spotify_id} from {PLAYLISTS_DB_PATH}: {e}",
             exc_info=True,
         )
         return track_ids
 
 
-def get_playlist_tracks_with_snapshot_from_db(
-    playlist_spotify_id: str,
-) -> dict[str, dict[str, str]]:
-    """Retrieves all tracks with their snapshot_ids from a specific playlist's tracks table in playlists.db."""
-    table_name = f"playlist_{playlist_spotify_id.replace('-', '_')}"
-    tracks_data: dict[str, dict[str, str]] = {}
+def get_playlist_outdated_track_ids(
+    playlist_spotify_id: str, current_snapshot_id: str
+) -> list[str]:
+    """Retrieves the IDs of present tracks whose snapshot_id differs from current_snapshot_id."""
     try:
-        with _get_playlists_db_connection() as conn:  # Use playlists connection
+        with _playlists_read_connection() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = None
+            # Index-only: snapshot_id is part of the present-tracks covering index
             cursor.execute(
-                f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}';"
-            )
-            if cursor.fetchone() is None:
-                logger.warning(
-                    f"Track table {table_name} does not exist in {PLAYLISTS_DB_PATH}. Cannot fetch track data."
-                )
-                return tracks_data
-
-            # Ensure the table has the latest schema before querying
-            _ensure_table_schema(
-                cursor,
-                table_name,
-                EXPECTED_PLAYLIST_TRACKS_COLUMNS,
-                f"playlist tracks ({playlist_spotify_id})",
-            )
-
-            cursor.execute(
-                f"SELECT spotify_track_id, snapshot_id, title FROM {table_name} WHERE is_present_in_spotify = 1"
+                _SQL_SELECT_OUTDATED_TRACK_IDS,
+                (playlist_spotify_id, current_snapshot_id),
             )
-            rows = cursor.fetchall()
-            for row in rows:
-                tracks_data[row["spotify_track_id"]] = {
-                    "snapshot_id": row["snapshot_id"],
-                    "title": row["title"],
-                }
-        return tracks_data
+            return [row[0] for row in cursor]
     except sqlite3.Error as e:
         logger.error(
-            f"Error retrieving track data for playlist {playlist_spotify_id} from table {table_name} in {PLAYLISTS_DB_PATH}: {e}",
+            f"Error retrieving outdated tracks for playlist {playlist_spotify_id} from {PLAYLISTS_DB_PATH}: {e}",
             exc_info=True,
         )
-        return tracks_data
+        return []
 
 
 def get_playlist_total_tracks_from_db(playlist_spotify_id: str) -> int:
     """Retrieves the total number of tracks in the database for a specific playlist."""
-    table_name = f"playlist_{playlist_spotify_id.replace('-', '_')}"
     try:
-        with _get_playlists_db_connection() as conn:  # Use playlists connection
-            cursor = conn.cursor()
-            cursor.execute(
-                f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}';"
-            )
-            if cursor.fetchone() is None:
-                return 0
-
-            # Ensure the table has the latest schema before querying
-            _ensure_table_schema(
-                cursor,
-                table_name,
-                EXPECTED_PLAYLIST_TRACKS_COLUMNS,
-                f"playlist tracks ({playlist_spotify_id})",
-            )
-
-            cursor.execute(
-                f"SELECT COUNT(*) as count FROM {table_name} WHERE is_present_in_spotify = 1"
-            )
+        with _playlists_read_connection() as conn:
+            cursor = conn.execute(_SQL_COUNT_PRESENT_TRACKS, (playlist_spotify_id,))
             row = cursor.fetchone()
             return row["count"] if row else 0
     except sqlite3.Error as e:
         logger.error(
-            f"Error retrieving track count for playlist {playlist_spotify_id} from table {table_name} in {PLAYLISTS_DB_PATH}: {e}",
+            f"Error retrieving track count for playlist {playlist_spotify_id} from {PLAYLISTS_DB_PATH}: {e}",
             exc_info=True,
         )
         return 0
 
 
+def _join_artist_names(artists: list | None) -> str:
+    """Joins the non-empty names of Spotify artist objects with ', '."""
+    if not artists:
+        return ""
+    if len(artists) == 1:  # Common case: skip building a list
+        return artists[0].get("name") or ""
+    return ", ".join([artist["name"] for artist in artists if artist.get("name")])
+
+
 def add_tracks_to_playlist_db(
     playlist_spotify_id: str, tracks_data: list, snapshot_id: str = None
 ):
@@ -619,125 +962,101 @@ def add_tracks_to_playlist_db(
         tracks_data: List of track items from Spotify API
         snapshot_id: The current snapshot_id for this playlist update
     """
-    table_name = f"playlist_{playlist_spotify_id.replace('-', '_')}"
     if not tracks_data:
         return
 
-    current_time = int(time.time())
-    tracks_to_update = []
-    for track_item in tracks_data:
-        track = track_item.get("track")
-        if not track or not track.get("id"):
-            logger.warning(
-                f"Skipping track update due to missing data or ID in playlist {playlist_spotify_id}: {track_item}"
-            )
-            continue
-
-        artist_names = ", ".join(
-            [
-                artist["name"]
-                for artist in track.get("artists", [])
-                if artist.get("name")
-            ]
-        )
-        album_artist_names = ", ".join(
-            [
-                artist["name"]
-                for artist in track.get("album", {}).get("artists", [])
-                if artist.get("name")
-            ]
-        )
-
-        # Extract track number from the track object
-        track_number = track.get("track_number")
-        # Log the raw track_number value for debugging
-        if track_number is None or track_number == 0:
-            logger.debug(
-                f"Track '{track.get('name', 'Unknown')}' has track_number: {track_number} (raw API value)"
-            )
+    skipped_items: list = []
+    updated_items = 0
+
+    def _update_rows(current_time: int):
+        nonlocal updated_items
+        for track_item in tracks_data:
+            track = track_item.get("track")
+            if not track or not track.get("id"):
+                skipped_items.append(track_item)  # Logged after the batch
+                continue
+
+            track_get = track.get
+            album = track_get("album") or {}
+
+            # Extract track number from the track object
+            track_number = track_get("track_number")
+            # Log the raw track_number value for debugging
+            if track_number is None or track_number == 0:
+                logger.debug(
+                    "Track '%s' has track_number: %s (raw API value)",
+                    track_get("name", "Unknown"),
+                    track_number,
+                )
 
-        # Prepare tuple for UPDATE statement.
-        # Order: title, artist_names, album_name, album_artist_names, track_number,
-        # album_spotify_id, duration_ms, added_at_playlist,
-        # is_present_in_spotify, last_seen_in_spotify, snapshot_id, spotify_track_id (for WHERE)
-        tracks_to_update.append(
-            (
-                track.get("name", "N/A"),
-                artist_names,
-                track.get("album", {}).get("name", "N/A"),
-                album_artist_names,
+            updated_items += 1
+            # Tuple for the UPDATE statement.
+            # Order: title, artist_names, album_name, album_artist_names, track_number,
+            # album_spotify_id, duration_ms, added_at_playlist,
+            # is_present_in_spotify, last_seen_in_spotify, snapshot_id,
+            # playlist_spotify_id and spotify_track_id (for WHERE)
+            yield (
+                track_get("name", "N/A"),
+                _join_artist_names(track_get("artists")),
+                album.get("name", "N/A"),
+                _join_artist_names(album.get("artists")),
                 track_number,  # Use the extracted track_number
-                track.get("album", {}).get("id"),
-                track.get("duration_ms"),
+                album.get("id"),
+                track_get("duration_ms"),
                 track_item.get("added_at"),  # From playlist item, update if changed
                 1,  # is_present_in_spotify flag
                 current_time,  # last_seen_in_spotify timestamp
                 snapshot_id,  # Update snapshot_id for this track
+                playlist_spotify_id,  # playlist_spotify_id for the WHERE clause
                 track["id"],  # spotify_track_id for the WHERE clause
             )
-        )
-
-    if not tracks_to_update:
-        logger.info(
-            f"No valid tracks to prepare for update for playlist {playlist_spotify_id}."
-        )
-        return
 
     try:
-        with _get_playlists_db_connection() as conn:  # Use playlists connection
-            cursor = conn.cursor()
-            # The table should have been created when the playlist was added to watch
-            # or when the first track was successfully downloaded.
-            # _create_playlist_tracks_table(playlist_spotify_id) # Not strictly needed here if table creation is robust elsewhere.
-
-            # The fields in SET must match the order of ?s, excluding the last one for WHERE.
-            # This will only update rows where spotify_track_id matches.
-            cursor.executemany(
-                f"""
-                UPDATE {table_name} SET
-                    title = ?,
-                    artist_names = ?,
-                    album_name = ?,
-                    album_artist_names = ?,
-                    track_number = ?,
-                    album_spotify_id = ?,
-                    duration_ms = ?,
-                    added_at_playlist = ?,
-                    is_present_in_spotify = ?,
-                    last_seen_in_spotify = ?,
-                    snapshot_id = ?
-                WHERE spotify_track_id = ?
-            """,
-                tracks_to_update,
-            )
-            conn.commit()
-            logger.info(
-                f"Attempted to update metadata for {len(tracks_to_update)} tracks from API in DB for playlist {playlist_spotify_id}. Actual rows updated: {cursor.rowcount if cursor.rowcount != -1 else 'unknown'}."
+        with _playlists_write_connection() as conn:
+            # Rows are streamed into executemany rather than collected in a list first.
+            # This will only update rows of this playlist where spotify_track_id matches.
+            cursor = conn.executemany(
+                _SQL_UPDATE_TRACK_FROM_API, _update_rows(int(time.time()))
             )
     except sqlite3.Error as e:
         logger.error(
-            f"Error updating tracks in playlist {playlist_spotify_id} in table {table_name} in {PLAYLISTS_DB_PATH}: {e}",
+            f"Error updating tracks in playlist {playlist_spotify_id} in {PLAYLISTS_DB_PATH}: {e}",
             exc_info=True,
         )
         # Not raising here to allow other operations to continue if one batch fails.
+        return
+
+    for track_item in skipped_items:
+        logger.warning(
+            "Skipping track update due to missing data or ID in playlist %s: %s",
+            playlist_spotify_id,
+            track_item,
+        )
+    if not updated_items:
+        logger.info(
+            f"No valid tracks to prepare for update for playlist {playlist_spotify_id}."
+        )
+        return
+    logger.info(
+        f"Attempted to update metadata for {updated_items} tracks from API in DB for playlist {playlist_spotify_id}. Actual rows updated: {cursor.rowcount if cursor.rowcount != -1 else 'unknown'}."
+    )
 
 
 def mark_tracks_as_not_present_in_spotify(
     playlist_spotify_id: str, track_ids_to_mark: list
 ):
     """Marks specified tracks as not present in the Spotify playlist anymore in playlists.db."""
-    table_name = f"playlist_{playlist_spotify_id.replace('-', '_')}"
     if not track_ids_to_mark:
         return
     try:
-        with _get_playlists_db_connection() as conn:  # Use playlists connection
-            cursor = conn.cursor()
-            placeholders = ",".join("?" for _ in track_ids_to_mark)
-            sql = f"UPDATE {table_name} SET is_present_in_spotify = 0 WHERE spotify_track_id IN ({placeholders})"
-            cursor.execute(sql, track_ids_to_mark)
-            conn.commit()
+        with _playlists_write_connection() as conn:
+            cursor = conn.execute(
+                _SQL_MARK_TRACKS_NOT_PRESENT,
+                (playlist_spotify_id, json.dumps(list(track_ids_to_mark))),
+            )
+            marked_count = cursor.rowcount
             logger.info(
-                f"Marked {cursor.rowcount} tracks as not present in Spotify for playlist {playlist_spotify_id} in {PLAYLISTS_DB_PATH}."
+                f"Marked {marked_count} tracks as not present in Spotify for playlist {playlist_spotify_id} in {PLAYLISTS_DB_PATH}."
             )
     except sqlite3.Error as e:
         logger.error(
@@ -753,7 +1072,6 @@ def add_specific_tracks_to_playlist_table(
     Adds specific tracks (with full details fetched separately) to the playlist's table.
     This is used when a user manually marks tracks as "downloaded" or "known".
     """
-    table_name = f"playlist_{playlist_spotify_id.replace('-', '_')}"
     if not track_details_list:
         return
 
@@ -765,34 +1083,23 @@ def add_specific_tracks_to_playlist_table(
     ) in track_details_list:  # track here is assumed to be a full Spotify TrackObject
         if not track or not track.get("id"):
             logger.warning(
-                f"Skipping track due to missing data or ID (manual add) in playlist {playlist_spotify_id}: {track}"
+                "Skipping track due to missing data or ID (manual add) in playlist %s: %s",
+                playlist_spotify_id,
+                track,
             )
             continue
 
-        artist_names = ", ".join(
-            [
-                artist["name"]
-                for artist in track.get("artists", [])
-                if artist.get("name")
-            ]
-        )
-        album_artist_names = ", ".join(
-            [
-                artist["name"]
-                for artist in track.get("album", {}).get("artists", [])
-                if artist.get("name")
-            ]
-        )
-
+        album = track.get("album") or {}
         tracks_to_insert.append(
             (
+                playlist_spotify_id,
                 track["id"],
                 track.get("name", "N/A"),
-                artist_names,
-                track.get("album", {}).get("name", "N/A"),
-                album_artist_names,
+                _join_artist_names(track.get("artists")),
+                album.get("name", "N/A"),
+                _join_artist_names(album.get("artists")),
                 track.get("track_number"),
-                track.get("album", {}).get("id"),
+                album.get("id"),
                 track.get("duration_ms"),
                 None,  # added_at_playlist - not known for manually added tracks this way
                 current_time,  # added_to_db
@@ -808,24 +1115,14 @@ def add_specific_tracks_to_playlist_table(
         return
 
     try:
-        with _get_playlists_db_connection() as conn:  # Use playlists connection
-            cursor = conn.cursor()
-            _create_playlist_tracks_table(playlist_spotify_id)  # Ensure table exists
-            cursor.executemany(
-                f"""
-                INSERT OR REPLACE INTO {table_name}
-                (spotify_track_id, title, artist_names, album_name, album_artist_names, track_number, album_spotify_id, duration_ms, added_at_playlist, added_to_db, is_present_in_spotify, last_seen_in_spotify)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                tracks_to_insert,
-            )
-            conn.commit()
+        with _playlists_write_connection() as conn:
+            conn.executemany(_SQL_UPSERT_MANUAL_TRACK, tracks_to_insert)
             logger.info(
                 f"Manually added/updated {len(tracks_to_insert)} tracks in DB for playlist {playlist_spotify_id} in {PLAYLISTS_DB_PATH}."
             )
     except sqlite3.Error as e:
         logger.error(
-            f"Error manually adding tracks to playlist {playlist_spotify_id} in table {table_name} in {PLAYLISTS_DB_PATH}: {e}",
+            f"Error manually adding tracks to playlist {playlist_spotify_id} in {PLAYLISTS_DB_PATH}: {e}",
             exc_info=True,
         )
 
@@ -834,29 +1131,15 @@ def remove_specific_tracks_from_playlist_table(
     playlist_spotify_id: str, track_spotify_ids: list
 ):
     """Removes specific tracks from the playlist's local DB table."""
-    table_name = f"playlist_{playlist_spotify_id.replace('-', '_')}"
     if not track_spotify_ids:
         return 0
 
     try:
-        with _get_playlists_db_connection() as conn:
-            cursor = conn.cursor()
-            placeholders = ",".join("?" for _ in track_spotify_ids)
-            # Check if table exists first
-            cursor.execute(
-                f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}';"
-            )
-            if cursor.fetchone() is None:
-                logger.warning(
-                    f"Track table {table_name} does not exist. Cannot remove tracks."
-                )
-                return 0
-
-            cursor.execute(
-                f"DELETE FROM {table_name} WHERE spotify_track_id IN ({placeholders})",
-                track_spotify_ids,
+        with _playlists_write_connection() as conn:
+            cursor = conn.execute(
+                _SQL_DELETE_TRACKS,
+                (playlist_spotify_id, json.dumps(list(track_spotify_ids))),
             )
-            conn.commit()
             deleted_count = cursor.rowcount
             logger.info(
                 f"Successfully removed {deleted_count} tracks locally for playlist {playlist_spotify_id}."
@@ -864,43 +1147,57 @@ def remove_specific_tracks_from_playlist_table(
             return deleted_count
     except sqlite3.Error as e:
         logger.error(
-            f"Error manually removing tracks for playlist {playlist_spotify_id} from table {table_name}: {e}",
+            f"Error manually removing tracks for playlist {playlist_spotify_id} from {PLAYLISTS_DB_PATH}: {e}",
             exc_info=True,
         )
         return 0
 
 
-def add_single_track_to_playlist_db(
-    playlist_spotify_id: str,
-    track_item_for_db: dict,
-    snapshot_id: str = None,
-    task_id: str = None,
-):
-    """
-    Adds or updates a single track in the specified playlist's tracks table in playlists.db.
-    Uses deezspot callback data as the source of metadata.
+@dataclass(slots=True)
+class TrackMeta:
+    """Track metadata taken from a deezspot 'done' callback."""
 
-    Args:
-        playlist_spotify_id: The Spotify playlist ID
-        track_item_for_db: Track item data (used only for spotify_track_id and added_at)
-        snapshot_id: The playlist snapshot ID
-        task_id: Task ID to extract metadata from callback data
+    title: str
+    artist_names: str
+    album_name: str
+    album_artist_names: str
+    track_number: int
+    duration_ms: int
+    final_path: str | None = None
+
+
+def parse_deezspot_callback(callback_data: dict) -> TrackMeta | None:
+    """Extracts TrackMeta from deezspot callback data; None if it has no track object."""
+    # Structure as in callbacks.ts
+    track_obj = callback_data.get("track", {})
+    if not track_obj:
+        return None
+    album_obj = track_obj.get("album", {})
+    # final_path is a newer deezspot field in status_info
+    status_info = callback_data.get("status_info", {}) or {}
+    return TrackMeta(
+        title=track_obj.get("title", "N/A"),
+        artist_names=_join_artist_names(track_obj.get("artists")) or "N/A",
+        album_name=album_obj.get("title", "N/A"),
+        album_artist_names=_join_artist_names(album_obj.get("artists")) or "N/A",
+        track_number=track_obj.get("track_number", 1),  # Default to 1 if missing
+        duration_ms=track_obj.get("duration_ms", 0),
+        final_path=status_info.get("final_path"),
+    )
+
+
+def _track_meta_from_task(
+    task_id: str | None, playlist_spotify_id: str
+) -> TrackMeta | None:
+    """
+    Parses the last deezspot callback stored for task_id. Returns None (after logging why)
+    if there is none.
     """
     if not task_id:
         logger.error(
             f"No task_id provided for playlist {playlist_spotify_id}. Task ID is required to extract metadata from deezspot callback."
         )
-        return
-
-    if not track_item_for_db or not track_item_for_db.get("track", {}).get("id"):
-        logger.error(
-            f"No track_item_for_db or spotify track ID provided for playlist {playlist_spotify_id}"
-        )
-        return
-
-    table_name = f"playlist_{playlist_spotify_id.replace('-', '_')}"
-
-    # Extract metadata ONLY from deezspot callback data
+        return None
     try:
         # Import here to avoid circular imports
         from routes.utils.celery_tasks import get_last_task_status
@@ -910,115 +1207,202 @@ def add_single_track_to_playlist_db(
             logger.error(
                 f"No raw_callback found in task status for task {task_id}. Cannot extract metadata."
             )
-            return
+            return None
 
-        callback_data = last_status["raw_callback"]
-
-        # Extract metadata from deezspot callback using correct structure from callbacks.ts
-        track_obj = callback_data.get("track", {})
-        if not track_obj:
+        track_meta = parse_deezspot_callback(last_status["raw_callback"])
+        if track_meta is None:
             logger.error(f"No track object found in callback data for task {task_id}")
-            return
-
-        track_name = track_obj.get("title", "N/A")
-        track_number = track_obj.get("track_number", 1)  # Default to 1 if missing
-        duration_ms = track_obj.get("duration_ms", 0)
-
-        # Extract artist names from artists array
-        artists = track_obj.get("artists", [])
-        artist_names = ", ".join(
-            [artist.get("name", "") for artist in artists if artist.get("name")]
-        )
-        if not artist_names:
-            artist_names = "N/A"
-
-        # Extract album information
-        album_obj = track_obj.get("album", {})
-        album_name = album_obj.get("title", "N/A")
-
-        # Extract album artist names from album artists array
-        album_artists = album_obj.get("artists", [])
-        album_artist_names = ", ".join(
-            [artist.get("name", "") for artist in album_artists if artist.get("name")]
-        )
-        if not album_artist_names:
-            album_artist_names = "N/A"
-
-        # Extract final_path from status_info if present (new deezspot field)
-        status_info = callback_data.get("status_info", {}) or {}
-        final_path = status_info.get("final_path")
-
-        logger.debug(
-            f"Extracted metadata from deezspot callback for '{track_name}': track_number={track_number}, final_path={final_path}"
-        )
-
+        return track_meta
     except Exception as e:
         logger.error(
             f"Error extracting metadata from task {task_id} callback: {e}",
             exc_info=True,
         )
-        return
+        return None
 
-    current_time = int(time.time())
 
+def _build_downloaded_track_row(
+    playlist_spotify_id: str,
+    track_item_for_db: dict,
+    snapshot_id: str | None,
+    track_meta: TrackMeta,
+    current_time: int,
+) -> tuple:
+    """Builds the playlist_tracks row for a downloaded track."""
     # Get spotify_track_id and added_at from original track_item_for_db
-    track_id = track_item_for_db["track"]["id"]
+    track = track_item_for_db["track"]
+    track_id = track["id"]
     added_at = track_item_for_db.get("added_at")
-    album_id = (
-        track_item_for_db.get("track", {}).get("album", {}).get("id")
-    )  # Only album ID from original data
+    album_id = (track.get("album") or {}).get("id")  # Only album ID from original data
 
-    logger.info(
-        f"Adding track '{track_name}' (ID: {track_id}) to playlist {playlist_spotify_id} with track_number: {track_number} (from deezspot callback)"
+    # Per-track line; the batch summary is logged at INFO by the caller
+    logger.debug(
+        "Adding track '%s' (ID: %s) to playlist %s with track_number: %s (from deezspot callback)",
+        track_meta.title,
+        track_id,
+        playlist_spotify_id,
+        track_meta.track_number,
     )
 
-    track_data_tuple = (
+    return (
+        playlist_spotify_id,
         track_id,
-        track_name,
-        artist_names,
-        album_name,
-        album_artist_names,
-        track_number,
+        track_meta.title,
+        track_meta.artist_names,
+        track_meta.album_name,
+        track_meta.album_artist_names,
+        track_meta.track_number,
         album_id,
-        duration_ms,
+        track_meta.duration_ms,
         added_at,
         current_time,
         1,
         current_time,
         snapshot_id,
-        final_path,
+        track_meta.final_path,
     )
-    try:
-        with _get_playlists_db_connection() as conn:  # Use playlists connection
-            cursor = conn.cursor()
-            _create_playlist_tracks_table(playlist_spotify_id)
-            cursor.execute(
-                f"""
-                INSERT OR REPLACE INTO {table_name}
-                (spotify_track_id, title, artist_names, album_name, album_artist_names, track_number, album_spotify_id, duration_ms, added_at_playlist, added_to_db, is_present_in_spotify, last_seen_in_spotify, snapshot_id, final_path)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-                track_data_tuple,
+
+
+def add_downloaded_tracks_to_playlist_db(
+    playlist_spotify_id: str,
+    downloaded_items: list[tuple[dict, TrackMeta | str]],
+    snapshot_id: str = None,
+) -> int:
+    """
+    Adds or updates several downloaded tracks of a playlist in playlists.db in one transaction.
+    Uses deezspot callback data as the source of metadata.
+
+    Args:
+        playlist_spotify_id: The Spotify playlist ID
+        downloaded_items: (track_item_for_db, TrackMeta or task_id) pairs, one per finished
+            download. For a task_id the metadata is read from the task's last callback.
+        snapshot_id: The playlist snapshot ID
+
+    Returns:
+        The number of tracks written.
+    """
+    current_time = int(time.time())
+    rows = []
+    for track_item_for_db, meta_or_task_id in downloaded_items:
+        if not track_item_for_db or not track_item_for_db.get("track", {}).get("id"):
+            logger.error(
+                f"No track_item_for_db or spotify track ID provided for playlist {playlist_spotify_id}"
+            )
+            continue
+        if isinstance(meta_or_task_id, TrackMeta):
+            track_meta = meta_or_task_id
+        else:
+            track_meta = _track_meta_from_task(meta_or_task_id, playlist_spotify_id)
+            if track_meta is None:
+                continue
+        rows.append(
+            _build_downloaded_track_row(
+                playlist_spotify_id,
+                track_item_for_db,
+                snapshot_id,
+                track_meta,
+                current_time,
             )
-            conn.commit()
+        )
+    if not rows:
+        return 0
+
+    try:
+        with _playlists_write_connection() as conn:
+            conn.executemany(_SQL_UPSERT_DOWNLOADED_TRACK, rows)
             logger.info(
-                f"Track '{track_name}' added/updated in DB for playlist {playlist_spotify_id} in {PLAYLISTS_DB_PATH}."
+                f"{len(rows)} downloaded track(s) added/updated in DB for playlist {playlist_spotify_id} in {PLAYLISTS_DB_PATH}."
             )
+        return len(rows)
     except sqlite3.Error as e:
         logger.error(
-            f"Error adding single track to playlist {playlist_spotify_id} in {PLAYLISTS_DB_PATH}: {e}",
+            f"Error adding downloaded tracks to playlist {playlist_spotify_id} in {PLAYLISTS_DB_PATH}: {e}",
             exc_info=True,
         )
+        return 0
+
+
+def add_single_track_to_playlist_db(
+    playlist_spotify_id: str,
+    track_item_for_db: dict,
+    snapshot_id: str = None,
+    task_id: str = None,
+    track_meta: TrackMeta | None = None,
+):
+    """
+    Adds or updates a single track in the specified playlist's tracks table in playlists.db.
+    Uses deezspot callback data as the source of metadata.
+
+    Args:
+        playlist_spotify_id: The Spotify playlist ID
+        track_item_for_db: Track item data (used only for spotify_track_id and added_at)
+        snapshot_id: The playlist snapshot ID
+        task_id: Task ID to extract metadata from callback data
+        track_meta: Already parsed callback metadata; skips the task status lookup
+    """
+    add_downloaded_tracks_to_playlist_db(
+        playlist_spotify_id,
+        [(track_item_for_db, track_meta if track_meta is not None else task_id)],
+        snapshot_id,
+    )
 
 
 # --- Artist Watch Database Functions ---
 
+# Read-through cache for watched_artists rows, keyed by artist ID ("" for the full list).
+# Bounded LRU with a TTL: a write drops the written artist's entry and the list, and the
+# TTL bounds staleness from writes made by other processes. Unwatched IDs are not cached.
+_WATCHED_ARTISTS_CACHE_TTL_SECONDS = 30
+_WATCHED_ARTISTS_CACHE_MAX_ENTRIES = 256
+_WATCHED_ARTISTS_LIST_KEY = ""
+_watched_artists_cache: OrderedDict[str, tuple[float, object]] = OrderedDict()
+_watched_artists_cache_generation = 0
+_watched_artists_cache_lock = threading.Lock()
+_CACHE_MISS = object()
+
+
+def _watched_artists_cache_get(key: str):
+    with _watched_artists_cache_lock:
+        entry = _watched_artists_cache.get(key)
+        if entry is None:
+            return _CACHE_MISS
+        if entry[0] <= time.monotonic():
+            del _watched_artists_cache[key]
+            return _CACHE_MISS
+        _watched_artists_cache.move_to_end(key)
+        return entry[1]
+
+
+def _watched_artists_cache_put(key: str, value, generation: int) -> None:
+    with _watched_artists_cache_lock:
+        # Drop results loaded before an invalidation that raced with the load
+        if generation != _watched_artists_cache_generation:
+            return
+        _watched_artists_cache[key] = (
+            time.monotonic() + _WATCHED_ARTISTS_CACHE_TTL_SECONDS,
+            value,
+        )
+        _watched_artists_cache.move_to_end(key)
+        while len(_watched_artists_cache) > _WATCHED_ARTISTS_CACHE_MAX_ENTRIES:
+            _watched_artists_cache.popitem(last=False)
+
+
+def _invalidate_watched_artist(artist_spotify_id: str) -> None:
+    """Drops the cached row of one artist and the cached list that contains it."""
+    global _watched_artists_cache_generation
+    with _watched_artists_cache_lock:
+        _watched_artists_cache_generation += 1
+        _watched_artists_cache.pop(artist_spotify_id, None)
+        _watched_artists_cache.pop(_WATCHED_ARTISTS_LIST_KEY, None)
+
 
 def init_artists_db():
     """Initializes the artists database and creates/updates the main watched_artists table."""
     try:
         with _get_artists_db_connection() as conn:
             cursor = conn.cursor()
+            # DDL does not open a transaction implicitly; run the whole schema sync in one
+            _begin_immediate(conn)
             # Note: total_albums_on_spotify, genres, popularity, image_url added to EXPECTED_WATCHED_ARTISTS_COLUMNS
             # and will be added by _ensure_table_schema if missing.
             cursor.execute("""
@@ -1036,13 +1420,26 @@ def init_artists_db():
                 )
             """)
             # Ensure schema
-            if _ensure_table_schema(
+            _ensure_table_schema(
                 cursor,
                 "watched_artists",
                 EXPECTED_WATCHED_ARTISTS_COLUMNS,
                 "watched artists",
+            )
+            # Partial index: the watch loop only ever lists active artists
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_watched_artists_active "
+                "ON watched_artists(spotify_id) WHERE is_active = 1"
+            )
+            _create_artist_albums_table(cursor)
+            if _ensure_table_schema(
+                cursor,
+                ARTIST_ALBUMS_TABLE,
+                EXPECTED_ARTIST_ALBUMS_COLUMNS,
+                "artist albums",
             ):
-                conn.commit()
+                logger.info(f"Updated schema for {ARTIST_ALBUMS_TABLE} table")
+            _migrate_legacy_artist_album_tables(cursor)
             logger.info(
                 f"Artists database initialized/updated successfully at {ARTISTS_DB_PATH}"
             )
@@ -1054,69 +1451,101 @@ def init_artists_db():
         raise
 
 
-def _create_artist_albums_table(artist_spotify_id: str):
-    """Creates or updates a table for a specific artist to store their albums in artists.db."""
-    table_name = f"artist_{artist_spotify_id.replace('-', '_').replace(' ', '_')}"  # Sanitize table name
-    try:
-        with _get_artists_db_connection() as conn:  # Use artists connection
-            cursor = conn.cursor()
-            # Note: Several columns including artist_spotify_id, release_date_precision, image_url,
-            # last_seen_on_spotify, download_task_id, download_status, is_fully_downloaded_managed_by_app
-            # are part of EXPECTED_ARTIST_ALBUMS_COLUMNS and will be added by _ensure_table_schema.
-            cursor.execute(f"""
-                CREATE TABLE IF NOT EXISTS {table_name} (
-                    album_spotify_id TEXT PRIMARY KEY,
-                    artist_spotify_id TEXT,
-                    name TEXT,
-                    album_group TEXT,
-                    album_type TEXT,
-                    release_date TEXT,
-                    release_date_precision TEXT,
-                    total_tracks INTEGER,
-                    link TEXT,
-                    image_url TEXT,
-                    added_to_db INTEGER,
-                    last_seen_on_spotify INTEGER,
-                    download_task_id TEXT,
-                    download_status INTEGER DEFAULT 0,
-                    is_fully_downloaded_managed_by_app INTEGER DEFAULT 0
+def _create_artist_albums_table(cursor: sqlite3.Cursor):
+    """Creates the table holding the albums of every watched artist in artists.db."""
+    cursor.execute(f"""
+        CREATE TABLE IF NOT EXISTS {ARTIST_ALBUMS_TABLE} (
+            artist_spotify_id TEXT NOT NULL,
+            album_spotify_id TEXT NOT NULL,
+            name TEXT,
+            album_group TEXT,
+            album_type TEXT,
+            release_date TEXT,
+            release_date_precision TEXT,
+            total_tracks INTEGER,
+            link TEXT,
+            image_url TEXT,
+            added_to_db INTEGER,
+            last_seen_on_spotify INTEGER,
+            download_task_id TEXT,
+            download_status INTEGER DEFAULT 0,
+            is_fully_downloaded_managed_by_app INTEGER DEFAULT 0,
+            PRIMARY KEY (artist_spotify_id, album_spotify_id)
+        ) WITHOUT ROWID
+    """)
+
+
+def _migrate_legacy_artist_album_tables(cursor: sqlite3.Cursor):
+    """Copies rows from legacy artist_<id> tables into artist_albums and drops them.
+
+    Same per-table savepoint scheme as _migrate_legacy_playlist_track_tables.
+    """
+    cursor.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name LIKE 'artist_%' AND name != ?",
+        (ARTIST_ALBUMS_TABLE,),
+    )
+    legacy_tables = [row[0] for row in cursor.fetchall()]
+    if not legacy_tables:
+        return
+
+    # Table names were derived from the artist ID; map them back via the watchlist
+    cursor.execute("SELECT spotify_id FROM watched_artists")
+    artist_id_by_table = {
+        f"artist_{row[0].replace('-', '_').replace(' ', '_')}": row[0]
+        for row in cursor.fetchall()
+    }
+    target_columns = set(EXPECTED_ARTIST_ALBUMS_COLUMNS) - {"artist_spotify_id"}
+
+    for table_name in legacy_tables:
+        artist_spotify_id = artist_id_by_table.get(
+            table_name, table_name[len("artist_") :]
+        )
+        cursor.execute("SAVEPOINT migrate_legacy_artist")
+        try:
+            cursor.execute(f'PRAGMA table_info("{table_name}")')
+            columns = [row[1] for row in cursor.fetchall() if row[1] in target_columns]
+            if "album_spotify_id" in columns:
+                column_list = ", ".join(columns)
+                cursor.execute(
+                    f"""
+                    INSERT OR IGNORE INTO {ARTIST_ALBUMS_TABLE} (artist_spotify_id, {column_list})
+                    SELECT ?, {column_list} FROM "{table_name}"
+                """,
+                    (artist_spotify_id,),
                 )
-            """)
-            # Ensure schema for the specific artist's album table
-            if _ensure_table_schema(
-                cursor,
-                table_name,
-                EXPECTED_ARTIST_ALBUMS_COLUMNS,
-                f"artist albums ({artist_spotify_id})",
-            ):
-                conn.commit()
+            cursor.execute(f'DROP TABLE "{table_name}"')
+            cursor.execute("RELEASE migrate_legacy_artist")
             logger.info(
-                f"Albums table '{table_name}' created/updated or already exists in {ARTISTS_DB_PATH}."
+                f"Migrated legacy artist table '{table_name}' into {ARTIST_ALBUMS_TABLE}."
+            )
+        except sqlite3.Error as e:
+            cursor.execute("ROLLBACK TO migrate_legacy_artist")
+            cursor.execute("RELEASE migrate_legacy_artist")
+            logger.error(
+                f"Error migrating legacy artist table '{table_name}': {e}",
+                exc_info=True,
             )
-    except sqlite3.Error as e:
-        logger.error(
-            f"Error creating artist albums table {table_name} in {ARTISTS_DB_PATH}: {e}",
-            exc_info=True,
-        )
-        raise
 
 
 def add_artist_to_watch(artist_data: dict):
-    """Adds an artist to the watched_artists table and creates its albums table in artists.db."""
+    """Adds an artist to the watched_artists table in artists.db."""
     artist_id = artist_data.get("id")
     if not artist_id:
         logger.error("Cannot add artist to watch: Missing 'id' in artist_data.")
         return
 
     try:
-        _create_artist_albums_table(artist_id)
         with _get_artists_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+            conn.execute(
                 """
-                INSERT OR REPLACE INTO watched_artists
+                INSERT INTO watched_artists
                 (spotify_id, name, total_albums_on_spotify, last_checked, added_at, is_active)
                 VALUES (?, ?, ?, ?, ?, 1)
+                ON CONFLICT(spotify_id) DO UPDATE SET
+                    name = excluded.name,
+                    total_albums_on_spotify = excluded.total_albums_on_spotify,
+                    last_checked = excluded.last_checked,
+                    is_active = 1
             """,
                 (
                     artist_id,
@@ -1126,10 +1555,10 @@ def add_artist_to_watch(artist_data: dict):
                     int(time.time()),
                 ),
             )
-            conn.commit()
             logger.info(
                 f"Artist '{artist_data.get('name')}' ({artist_id}) added to watchlist in {ARTISTS_DB_PATH}."
             )
+        _invalidate_watched_artist(artist_id)
     except sqlite3.Error as e:
         logger.error(
             f"Error adding artist {artist_id} to watchlist in {ARTISTS_DB_PATH}: {e}",
@@ -1145,19 +1574,17 @@ def add_artist_to_watch(artist_data: dict):
 
 
 def remove_artist_from_watch(artist_spotify_id: str):
-    """Removes an artist from watched_artists and drops its albums table in artists.db."""
-    table_name = f"artist_{artist_spotify_id.replace('-', '_')}"
+    """Removes an artist from watched_artists and deletes its albums in artists.db."""
     try:
         with _get_artists_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+            cursor = conn.execute(
                 "DELETE FROM watched_artists WHERE spotify_id = ?", (artist_spotify_id,)
             )
-            cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-            conn.commit()
+            cursor.execute(_SQL_DELETE_ALL_ARTIST_ALBUMS, (artist_spotify_id,))
             logger.info(
-                f"Artist {artist_spotify_id} removed from watchlist and its table '{table_name}' dropped from {ARTISTS_DB_PATH}."
+                f"Artist {artist_spotify_id} removed from watchlist and its albums deleted in {ARTISTS_DB_PATH}."
             )
+        _invalidate_watched_artist(artist_spotify_id)
     except sqlite3.Error as e:
         logger.error(
             f"Error removing artist {artist_spotify_id} from watchlist in {ARTISTS_DB_PATH}: {e}",
@@ -1168,12 +1595,19 @@ def remove_artist_from_watch(artist_spotify_id: str):
 
 def get_watched_artists():
     """Retrieves all active artists from the watched_artists table in artists.db."""
+    cached = _watched_artists_cache_get(_WATCHED_ARTISTS_LIST_KEY)
+    if cached is not _CACHE_MISS:
+        return [dict(artist) for artist in cached]
+    generation = _watched_artists_cache_generation
     try:
-        with _get_artists_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute("SELECT * FROM watched_artists WHERE is_active = 1")
-            artists = [dict(row) for row in cursor.fetchall()]
-            return artists
+        with _artists_read_connection() as conn:
+            # Explicit rowid order: the partial index would otherwise return them by ID
+            cursor = conn.execute(
+                "SELECT * FROM watched_artists WHERE is_active = 1 ORDER BY rowid"
+            )
+            artists = _fetch_all_dicts(cursor)
+        _watched_artists_cache_put(_WATCHED_ARTISTS_LIST_KEY, artists, generation)
+        return [dict(artist) for artist in artists]
     except sqlite3.Error as e:
         logger.error(
             f"Error retrieving watched artists from {ARTISTS_DB_PATH}: {e}",
@@ -1182,17 +1616,41 @@ def get_watched_artists():
         return []
 
 
+def get_watched_artist_ids() -> list[str]:
+    """Retrieves the Spotify IDs of all active watched artists (no row materialization)."""
+    try:
+        with _artists_read_connection() as conn:
+            # Same insertion order as get_watched_artists, which the scheduler relies on
+            cursor = conn.execute(
+                "SELECT spotify_id FROM watched_artists WHERE is_active = 1 ORDER BY rowid"
+            )
+            cursor.row_factory = None
+            return [row[0] for row in cursor]
+    except sqlite3.Error as e:
+        logger.error(
+            f"Error retrieving watched artist IDs from {ARTISTS_DB_PATH}: {e}",
+            exc_info=True,
+        )
+        return []
+
+
 def get_watched_artist(artist_spotify_id: str):
     """Retrieves a specific artist from the watched_artists table in artists.db."""
+    cached = _watched_artists_cache_get(artist_spotify_id)
+    if cached is not _CACHE_MISS:
+        return dict(cached)
+    generation = _watched_artists_cache_generation
     try:
-        with _get_artists_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        with _artists_read_connection() as conn:
+            cursor = conn.execute(
                 "SELECT * FROM watched_artists WHERE spotify_id = ?",
                 (artist_spotify_id,),
             )
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            artist = cursor.fetchone()
+        if artist is None:
+            return None
+        _watched_artists_cache_put(artist_spotify_id, artist, generation)
+        return dict(artist)
     except sqlite3.Error as e:
         logger.error(
             f"Error retrieving artist {artist_spotify_id} from {ARTISTS_DB_PATH}: {e}",
@@ -1207,8 +1665,7 @@ def update_artist_metadata_after_check(
     """Updates the total_albums_on_spotify and last_checked for an artist in artists.db."""
     try:
         with _get_artists_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+            conn.execute(
                 """
                 UPDATE watched_artists
                 SET total_albums_on_spotify = ?, last_checked = ?
@@ -1216,7 +1673,7 @@ def update_artist_metadata_after_check(
             """,
                 (total_albums_from_api, int(time.time()), artist_spotify_id),
             )
-            conn.commit()
+        _invalidate_watched_artist(artist_spotify_id)
     except sqlite3.Error as e:
         logger.error(
             f"Error updating metadata for artist {artist_spotify_id} in {ARTISTS_DB_PATH}: {e}",
@@ -1229,9 +1686,8 @@ def update_artist_metadata_after_check(
 
 def get_artist_batch_next_offset(artist_spotify_id: str) -> int:
     try:
-        with _get_artists_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+        with _artists_read_connection() as conn:
+            cursor = conn.execute(
                 "SELECT batch_next_offset FROM watched_artists WHERE spotify_id = ?",
                 (artist_spotify_id,),
             )
@@ -1254,8 +1710,7 @@ def get_artist_batch_next_offset(artist_spotify_id: str) -> int:
 def set_artist_batch_next_offset(artist_spotify_id: str, next_offset: int) -> None:
     try:
         with _get_artists_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
+            conn.execute(
                 """
                 UPDATE watched_artists
                 SET batch_next_offset = ?
@@ -1263,7 +1718,7 @@ def set_artist_batch_next_offset(artist_spotify_id: str, next_offset: int) -> No
                 """,
                 (int(next_offset or 0), artist_spotify_id),
             )
-            conn.commit()
+        _invalidate_watched_artist(artist_spotify_id)
     except sqlite3.Error as e:
         logger.error(
             f"Error updating batch_next_offset for artist {artist_spotify_id}: {e}",
@@ -1272,31 +1727,48 @@ def set_artist_batch_next_offset(artist_spotify_id: str, next_offset: int) -> No
 
 
 def get_artist_album_ids_from_db(artist_spotify_id: str):
-    """Retrieves all album Spotify IDs from a specific artist's albums table in artists.db."""
-    table_name = f"artist_{artist_spotify_id.replace('-', '_')}"
-    album_ids: set[str] = set()
+    """Retrieves all album Spotify IDs stored for an artist in artists.db."""
     try:
-        with _get_artists_db_connection() as conn:
+        with _artists_read_connection() as conn:
             cursor = conn.cursor()
-            cursor.execute(
-                f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}';"
-            )
-            if cursor.fetchone() is None:
-                logger.warning(
-                    f"Album table {table_name} for artist {artist_spotify_id} does not exist in {ARTISTS_DB_PATH}. Cannot fetch album IDs."
-                )
-                return album_ids
-            cursor.execute(f"SELECT album_spotify_id FROM {table_name}")
-            rows = cursor.fetchall()
-            for row in rows:
-                album_ids.add(row["album_spotify_id"])
-        return album_ids
+            cursor.row_factory = None
+            cursor.execute(_SQL_SELECT_ARTIST_ALBUM_IDS, (artist_spotify_id,))
+            return {row[0] for row in cursor}
     except sqlite3.Error as e:
         logger.error(
             f"Error retrieving album IDs for artist {artist_spotify_id} from {ARTISTS_DB_PATH}: {e}",
             exc_info=True,
         )
-        return album_ids
+        return set()
+
+
+def _build_artist_album_row(
+    artist_spotify_id: str,
+    album_data: dict,
+    task_id: str | None,
+    is_download_complete: bool,
+    current_time: int,
+) -> tuple:
+    """Builds the artist_albums row (in _SQL_UPSERT_ARTIST_ALBUM order) for an album with an ID."""
+    album_id = album_data["id"]
+    images = album_data.get("images") or []
+    return (
+        artist_spotify_id,
+        album_id,
+        album_data.get("name", "N/A"),
+        album_data.get("album_group", "N/A"),
+        album_data.get("album_type", "N/A"),
+        album_data.get("release_date"),
+        album_data.get("release_date_precision"),
+        album_data.get("total_tracks"),
+        f"https://open.spotify.com/album/{album_id}",
+        images[0].get("url") if images and images[0].get("url") else None,
+        current_time,  # added_to_db
+        current_time,  # last_seen_on_spotify
+        task_id,  # download_task_id
+        _DOWNLOAD_STATUS_BY_FLAGS[(bool(task_id), bool(is_download_complete))],
+        0,  # is_fully_downloaded_managed_by_app
+    )
 
 
 def add_or_update_album_for_artist(
@@ -1305,14 +1777,13 @@ def add_or_update_album_for_artist(
     task_id: str = None,
     is_download_complete: bool = False,
 ):
-    """Adds or updates an album in the specified artist's albums table in artists.db.
+    """Adds or updates an album of the specified artist in artists.db.
 
     This function aligns with the schema defined by EXPECTED_ARTIST_ALBUMS_COLUMNS:
       - download_task_id: TEXT
       - download_status: INTEGER (0: Not Queued, 1: Queued/In Progress, 2: Downloaded, 3: Error)
       - is_fully_downloaded_managed_by_app: INTEGER (0/1)
     """
-    table_name = f"artist_{artist_spotify_id.replace('-', '_')}"
     album_id = album_data.get("id")
     if not album_id:
         logger.warning(
@@ -1320,114 +1791,19 @@ def add_or_update_album_for_artist(
         )
         return
 
-    # Map status according to provided flags
-    download_status = 2 if is_download_complete else (1 if task_id else 0)
-
-    current_time = int(time.time())
-
-    # Build derived fields from Spotify album data
-    album_name = album_data.get("name", "N/A")
-    album_group = album_data.get("album_group", "N/A")
-    album_type = album_data.get("album_type", "N/A")
-    release_date = album_data.get("release_date")
-    release_date_precision = album_data.get("release_date_precision")
-    total_tracks = album_data.get("total_tracks")
-    link = f"https://open.spotify.com/album/{album_id}"
-    images = album_data.get("images") or []
-    image_url = images[0].get("url") if images and images[0].get("url") else None
-
+    row = _build_artist_album_row(
+        artist_spotify_id, album_data, task_id, is_download_complete, int(time.time())
+    )
     try:
         with _get_artists_db_connection() as conn:
-            cursor = conn.cursor()
-            _create_artist_albums_table(artist_spotify_id)
-
-            # Determine if row exists (and keep original added_to_db on update)
-            cursor.execute(
-                f"SELECT added_to_db FROM {table_name} WHERE album_spotify_id = ?",
-                (album_id,),
+            # One statement either way; an existing row keeps its added_to_db
+            conn.execute(_SQL_UPSERT_ARTIST_ALBUM, row)
+            logger.debug(
+                "Added/updated album '%s' in DB for artist %s in %s.",
+                row[2],
+                artist_spotify_id,
+                ARTISTS_DB_PATH,
             )
-            existing_row = cursor.fetchone()
-
-            if existing_row:
-                update_tuple = (
-                    album_name,
-                    album_group,
-                    album_type,
-                    release_date,
-                    release_date_precision,
-                    total_tracks,
-                    link,
-                    image_url,
-                    current_time,  # last_seen_on_spotify
-                    download_status,
-                    task_id,  # download_task_id
-                    album_id,
-                )
-                cursor.execute(
-                    f"""
-                    UPDATE {table_name} SET
-                        name = ?,
-                        album_group = ?,
-                        album_type = ?,
-                        release_date = ?,
-                        release_date_precision = ?,
-                        total_tracks = ?,
-                        link = ?,
-                        image_url = ?,
-                        last_seen_on_spotify = ?,
-                        download_status = ?,
-                        download_task_id = ?
-                    WHERE album_spotify_id = ?
-                """,
-                    update_tuple,
-                )
-                logger.info(
-                    f"Updated album '{album_name}' in DB for artist {artist_spotify_id} in {ARTISTS_DB_PATH}."
-                )
-            else:
-                insert_tuple = (
-                    album_id,
-                    artist_spotify_id,
-                    album_name,
-                    album_group,
-                    album_type,
-                    release_date,
-                    release_date_precision,
-                    total_tracks,
-                    link,
-                    image_url,
-                    current_time,  # added_to_db
-                    current_time,  # last_seen_on_spotify
-                    task_id,  # download_task_id
-                    download_status,  # download_status
-                    0,  # is_fully_downloaded_managed_by_app
-                )
-                cursor.execute(
-                    f"""
-                    INSERT INTO {table_name} (
-                        album_spotify_id,
-                        artist_spotify_id,
-                        name,
-                        album_group,
-                        album_type,
-                        release_date,
-                        release_date_precision,
-                        total_tracks,
-                        link,
-                        image_url,
-                        added_to_db,
-                        last_seen_on_spotify,
-                        download_task_id,
-                        download_status,
-                        is_fully_downloaded_managed_by_app
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    insert_tuple,
-                )
-                logger.info(
-                    f"Added album '{album_name}' to DB for artist {artist_spotify_id} in {ARTISTS_DB_PATH}."
-                )
-            conn.commit()
     except sqlite3.Error as e:
         logger.error(
             f"Error adding/updating album {album_id} for artist {artist_spotify_id} in {ARTISTS_DB_PATH}: {e}",
@@ -1439,27 +1815,34 @@ def update_album_download_status_for_artist(
     artist_spotify_id: str, album_spotify_id: str, task_id: str, status: int
 ):
     """Updates the download_status and download_task_id for a specific album of an artist in artists.db."""
-    table_name = f"artist_{artist_spotify_id.replace('-', '_')}"
     try:
         with _get_artists_db_connection() as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                f"""
-                UPDATE {table_name}
-                SET download_status = ?, download_task_id = ?, last_seen_on_spotify = ?
-                WHERE album_spotify_id = ?
-            """,
-                (status, task_id, int(time.time()), album_spotify_id),
+            cursor = conn.execute(
+                _SQL_UPDATE_ALBUM_DOWNLOAD_STATUS,
+                (
+                    status,
+                    task_id,
+                    int(time.time()),
+                    artist_spotify_id,
+                    album_spotify_id,
+                ),
             )
             if cursor.rowcount == 0:
                 logger.warning(
-                    f"Attempted to update download status for non-existent album {album_spotify_id} for artist {artist_spotify_id} in {ARTISTS_DB_PATH}."
+                    "Attempted to update download status for non-existent album %s for artist %s in %s.",
+                    album_spotify_id,
+                    artist_spotify_id,
+                    ARTISTS_DB_PATH,
                 )
             else:
                 logger.info(
-                    f"Updated download status to {status} for album {album_spotify_id} (task: {task_id}) for artist {artist_spotify_id} in {ARTISTS_DB_PATH}."
+                    "Updated download status to %s for album %s (task: %s) for artist %s in %s.",
+                    status,
+                    album_spotify_id,
+                    task_id,
+                    artist_spotify_id,
+                    ARTISTS_DB_PATH,
                 )
-            conn.commit()
     except sqlite3.Error as e:
         logger.error(
             f"Error updating album download status for album {album_spotify_id}, artist {artist_spotify_id} in {ARTISTS_DB_PATH}: {e}",
@@ -1473,7 +1856,8 @@ def add_specific_albums_to_artist_table(
     """
     Adds specific albums (with full details fetched separately) to the artist's album table.
     This can be used when a user manually marks albums as "known" or "processed".
-    Albums added this way are marked with is_download_initiated = 3 (Manually Added/Known).
+    Albums added this way are stored with download_status = 2 (Downloaded/Known), in a
+    single executemany within one transaction.
     """
     if not album_details_list:
         logger.info(
@@ -1481,42 +1865,39 @@ def add_specific_albums_to_artist_table(
         )
         return 0
 
-    processed_count = 0
+    current_time = int(time.time())
+    albums_to_upsert = []
     for album_data in album_details_list:
         if not album_data or not album_data.get("id"):
             logger.warning(
-                f"Skipping album due to missing data or ID (manual add) for artist {artist_spotify_id}: {album_data}"
+                "Skipping album due to missing data or ID (manual add) for artist %s: %s",
+                artist_spotify_id,
+                album_data,
             )
             continue
-
-        # Use existing function to add/update, ensuring it handles manual state
-        # Set task_id to None and is_download_initiated to a specific state for manually added known albums
-        # The add_or_update_album_for_artist expects `is_download_complete` not `is_download_initiated` directly.
-        # We can adapt `add_or_update_album_for_artist` or pass status directly if it's modified to handle it.
-        # For now, let's pass task_id=None and a flag that implies manual addition (e.g. is_download_complete=True, and then modify add_or_update_album_for_artist status logic)
-        # Or, more directly, update the `is_download_initiated` field as part of the album_tuple for INSERT and in UPDATE.
-        # Let's stick to calling `add_or_update_album_for_artist` and adjust its status handling if needed.
-        # Setting `is_download_complete=True` and `task_id=None` should set `is_download_initiated = 2` (completed)
-        # We might need a new status like 3 for "Manually Marked as Known"
-        # For simplicity, we'll use `add_or_update_album_for_artist` and the status will be 'download_complete'.
-        # If a more distinct status is needed, `add_or_update_album_for_artist` would need adjustment.
-
-        # Simplification: we'll call add_or_update_album_for_artist which will mark it based on task_id presence or completion.
-        # For a truly "manual" state distinct from "downloaded", `add_or_update_album_for_artist` would need a new status value.
-        # Let's assume for now that adding it via this function means it's "known" and doesn't need downloading.
-        # The `add_or_update_album_for_artist` function sets is_download_initiated based on task_id and is_download_complete.
-        # If task_id is None and is_download_complete is True, it implies it's processed.
-        try:
-            add_or_update_album_for_artist(
-                artist_spotify_id, album_data, task_id=None, is_download_complete=True
-            )
-            processed_count += 1
-        except Exception as e:
-            logger.error(
-                f"Error manually adding album {album_data.get('id')} for artist {artist_spotify_id}: {e}",
-                exc_info=True,
+        # No task and is_download_complete=True: stored as downloaded (status 2), i.e.
+        # known to the app and never queued by the watcher.
+        albums_to_upsert.append(
+            _build_artist_album_row(
+                artist_spotify_id, album_data, None, True, current_time
             )
+        )
 
+    if not albums_to_upsert:
+        return 0
+
+    try:
+        with _get_artists_db_connection() as conn:
+            # Same upsert as add_or_update_album_for_artist, one statement for the list
+            conn.executemany(_SQL_UPSERT_ARTIST_ALBUM, albums_to_upsert)
+    except sqlite3.Error as e:
+        logger.error(
+            f"Error manually adding albums for artist {artist_spotify_id} in {ARTISTS_DB_PATH}: {e}",
+            exc_info=True,
+        )
+        return 0
+
+    processed_count = len(albums_to_upsert)
     logger.info(
         f"Manually added/updated {processed_count} albums in DB for artist {artist_spotify_id} in {ARTISTS_DB_PATH}."
     )
@@ -1526,30 +1907,16 @@ def add_specific_albums_to_artist_table(
 def remove_specific_albums_from_artist_table(
     artist_spotify_id: str, album_spotify_ids: list
 ):
-    """Removes specific albums from the artist's local album table."""
-    table_name = f"artist_{artist_spotify_id.replace('-', '_')}"
+    """Removes specific albums of the artist from the local album table."""
     if not album_spotify_ids:
         return 0
 
     try:
         with _get_artists_db_connection() as conn:
-            cursor = conn.cursor()
-            placeholders = ",".join("?" for _ in album_spotify_ids)
-            # Check if table exists first
-            cursor.execute(
-                f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}';"
+            cursor = conn.execute(
+                _SQL_DELETE_ARTIST_ALBUMS,
+                (artist_spotify_id, json.dumps(list(album_spotify_ids))),
             )
-            if cursor.fetchone() is None:
-                logger.warning(
-                    f"Album table {table_name} for artist {artist_spotify_id} does not exist. Cannot remove albums."
-                )
-                return 0
-
-            cursor.execute(
-                f"DELETE FROM {table_name} WHERE album_spotify_id IN ({placeholders})",
-                album_spotify_ids,
-            )
-            conn.commit()
             deleted_count = cursor.rowcount
             logger.info(
                 f"Manually removed {deleted_count} albums from DB for artist {artist_spotify_id}."
@@ -1557,7 +1924,7 @@ def remove_specific_albums_from_artist_table(
             return deleted_count
     except sqlite3.Error as e:
         logger.error(
-            f"Error manually removing albums for artist {artist_spotify_id} from table {table_name}: {e}",
+            f"Error manually removing albums for artist {artist_spotify_id} from {ARTISTS_DB_PATH}: {e}",
             exc_info=True,
         )
         return 0
@@ -1565,22 +1932,14 @@ def remove_specific_albums_from_artist_table(
 
 def is_track_in_playlist_db(playlist_spotify_id: str, track_spotify_id: str) -> bool:
     """Checks if a specific track Spotify ID exists in the given playlist's tracks table."""
-    table_name = f"playlist_{playlist_spotify_id.replace('-', '_')}"
     try:
-        with _get_playlists_db_connection() as conn:
-            cursor = conn.cursor()
-            # First, check if the table exists to prevent errors on non-watched or new playlists
-            cursor.execute(
-                f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}';"
-            )
-            if cursor.fetchone() is None:
-                return False  # Table doesn't exist, so track cannot be in it
-
-            cursor.execute(
-                f"SELECT 1 FROM {table_name} WHERE spotify_track_id = ?",
-                (track_spotify_id,),
+        with _playlists_read_connection() as conn:
+            return (
+                conn.execute(
+                    _SQL_TRACK_EXISTS, (playlist_spotify_id, track_spotify_id)
+                ).fetchone()
+                is not None
             )
-            return cursor.fetchone() is not None
     except sqlite3.Error as e:
         logger.error(
             f"Error checking if track {track_spotify_id} is in playlist {playlist_spotify_id} DB: {e}",
@@ -1590,35 +1949,127 @@ def is_track_in_playlist_db(playlist_spotify_id: str, track_spotify_id: str) ->
 
 
 def is_album_in_artist_db(artist_spotify_id: str, album_spotify_id: str) -> bool:
-    """Checks if a specific album Spotify ID exists in the given artist's albums table."""
-    table_name = f"artist_{artist_spotify_id.replace('-', '_')}"
+    """Checks if a specific album Spotify ID is stored for the given artist."""
     try:
-        with _get_artists_db_connection() as conn:
+        with _artists_read_connection() as conn:
+            return (
+                conn.execute(
+                    _SQL_ARTIST_ALBUM_EXISTS, (artist_spotify_id, album_spotify_id)
+                ).fetchone()
+                is not None
+            )
+    except sqlite3.Error as e:
+        logger.error(
+            f"Error checking if album {album_spotify_id} is in artist {artist_spotify_id} DB: {e}",
+            exc_info=True,
+        )
+        return False  # Assume not present on error
+
+
+def filter_missing_tracks(playlist_spotify_id: str, track_ids) -> set[str]:
+    """
+    Returns the subset of track_ids not stored for the playlist, using one query for the
+    whole batch. On error every id is treated as missing, like is_track_in_playlist_db.
+    """
+    wanted = {track_id for track_id in track_ids if track_id}
+    if not wanted:
+        return set()
+    try:
+        with _playlists_read_connection() as conn:
             cursor = conn.cursor()
-            # First, check if the table exists
+            cursor.row_factory = None
             cursor.execute(
-                f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}';"
+                _SQL_SELECT_KNOWN_TRACK_IDS,
+                (playlist_spotify_id, json.dumps(list(wanted))),
             )
-            if cursor.fetchone() is None:
-                return False  # Table doesn't exist
+            return wanted.difference(row[0] for row in cursor)
+    except sqlite3.Error as e:
+        logger.error(
+            f"Error checking {len(wanted)} tracks against playlist {playlist_spotify_id} DB: {e}",
+            exc_info=True,
+        )
+        return wanted
+
 
+def filter_present_track_ids(playlist_spotify_id: str, track_ids) -> set[str]:
+    """
+    Returns the subset of track_ids stored for the playlist and still present in Spotify.
+    Lets a batch check look up only its own ids instead of loading every track id of
+    the playlist. On error an empty set is returned, like get_playlist_track_ids_from_db.
+    """
+    wanted = {track_id for track_id in track_ids if track_id}
+    if not wanted:
+        return set()
+    try:
+        with _playlists_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
             cursor.execute(
-                f"SELECT 1 FROM {table_name} WHERE album_spotify_id = ?",
-                (album_spotify_id,),
+                _SQL_SELECT_PRESENT_TRACK_IDS_AMONG,
+                (playlist_spotify_id, json.dumps(list(wanted))),
             )
-            return cursor.fetchone() is not None
+            return {row[0] for row in cursor}
     except sqlite3.Error as e:
         logger.error(
-            f"Error checking if album {album_spotify_id} is in artist {artist_spotify_id} DB: {e}",
+            f"Error checking {len(wanted)} tracks against playlist {playlist_spotify_id} DB: {e}",
             exc_info=True,
         )
-        return False  # Assume not present on error
+        return set()
+
+
+def filter_missing_albums(artist_spotify_id: str, album_ids) -> set[str]:
+    """
+    Returns the subset of album_ids not stored for the artist, using one query for the
+    whole batch. On error every id is treated as missing, like is_album_in_artist_db.
+    """
+    wanted = {album_id for album_id in album_ids if album_id}
+    if not wanted:
+        return set()
+    try:
+        with _artists_read_connection() as conn:
+            cursor = conn.cursor()
+            cursor.row_factory = None
+            cursor.execute(
+                _SQL_SELECT_KNOWN_ALBUM_IDS,
+                (artist_spotify_id, json.dumps(list(wanted))),
+            )
+            return wanted.difference(row[0] for row in cursor)
+    except sqlite3.Error as e:
+        logger.error(
+            f"Error checking {len(wanted)} albums against artist {artist_spotify_id} DB: {e}",
+            exc_info=True,
+        )
+        return wanted
 
 
 # --- Eager module initialization to ensure DBs and core tables exist ---
 _initialized_on_import = False
 
 
+def optimize_watch_databases() -> None:
+    """
+    Runs PRAGMA optimize against both watch databases so the query planner keeps
+    up-to-date statistics for long-lived connections. Intended to be called periodically.
+    """
+    # 0x10002: analyze every table that would benefit, not only those this connection queried
+    try:
+        with _playlists_write_connection() as conn:
+            conn.execute("PRAGMA optimize=0x10002")
+    except sqlite3.Error as e:
+        logger.error(
+            f"Error optimizing {PLAYLISTS_DB_PATH}: {e}",
+            exc_info=True,
+        )
+    try:
+        with _get_artists_db_connection() as conn:
+            conn.execute("PRAGMA optimize=0x10002")
+    except sqlite3.Error as e:
+        logger.error(
+            f"Error optimizing {ARTISTS_DB_PATH}: {e}",
+            exc_info=True,
+        )
+
+
 def initialize_databases_eagerly() -> None:
     """Create DB directory and initialize core tables so they exist before any usage."""
     global _initialized_on_import
@@ -3,14 +3,16 @@ import threading
 import logging
 import json
 import re
+import copy
 from pathlib import Path
 from typing import Any, List, Dict
 
 from routes.utils.watch.db import (
     get_watched_playlists,
+    get_watched_playlist_ids,
     get_watched_playlist,
-    get_playlist_track_ids_from_db,
-    get_playlist_tracks_with_snapshot_from_db,
+    filter_present_track_ids,
+    get_playlist_outdated_track_ids,
     get_playlist_total_tracks_from_db,
     add_tracks_to_playlist_db,
     update_playlist_snapshot,
@@ -18,14 +20,18 @@ from routes.utils.watch.db import (
     ensure_playlist_table_schema,
     # Artist watch DB functions
     get_watched_artists,
+    get_watched_artist_ids,
     get_watched_artist,
-    get_artist_album_ids_from_db,
+    filter_missing_albums,
     update_artist_metadata_after_check,  # Renamed from update_artist_metadata
     # New batch progress helpers
     get_playlist_batch_progress,
     set_playlist_batch_progress,
+    playlists_write_transaction,
+    artists_write_transaction,
     get_artist_batch_next_offset,
     set_artist_batch_next_offset,
+    optimize_watch_databases,
 )
 from routes.utils.get_info import (
     get_spotify_info,
@@ -57,6 +63,10 @@ DEFAULT_WATCH_CONFIG = {
 # Round-robin index for one-item-per-interval scheduling
 _round_robin_index = 0
 
+# How often the scheduler refreshes SQLite planner statistics for the watch databases
+DB_OPTIMIZE_INTERVAL_SECONDS = 3600
+_last_db_optimize = time.monotonic()
+
 # Per-item locks to ensure only one run processes a given item at a time
 _playlist_locks: Dict[str, threading.RLock] = {}
 _artist_locks: Dict[str, threading.RLock] = {}
@@ -81,7 +91,45 @@ def _get_artist_lock(artist_spotify_id: str) -> threading.RLock:
         return lock
 
 
+# Parsed watch config, reused while main.json is unchanged (keyed by mtime and size)
+_watch_config_cache: Dict[str, Any] = {"stat_key": None, "config": None}
+_watch_config_lock = threading.Lock()
+
+
+def _main_config_stat_key():
+    try:
+        st = MAIN_CONFIG_FILE_PATH.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
 def get_watch_config():
+    """Returns the watch configuration from main.json's 'watch' key (camelCase).
+
+    The parsed result is cached and only re-read when main.json's mtime/size changes,
+    so the per-run and per-request calls cost a stat() instead of a JSON parse.
+    A legacy watch.json still pending migration always forces a reload.
+    """
+    with _watch_config_lock:
+        stat_key = _main_config_stat_key()
+        cached = _watch_config_cache["config"]
+        if (
+            cached is not None
+            and stat_key is not None
+            and stat_key == _watch_config_cache["stat_key"]
+            and not WATCH_OLD_FILE_PATH.exists()
+        ):
+            return copy.deepcopy(cached)
+
+        watch_cfg = _load_watch_config()
+        # Re-stat: loading may have written migrations or defaults back to main.json
+        _watch_config_cache["stat_key"] = _main_config_stat_key()
+        _watch_config_cache["config"] = watch_cfg
+        return copy.deepcopy(watch_cfg)
+
+
+def _load_watch_config():
     """Loads the watch configuration from main.json's 'watch' key (camelCase).
     Applies defaults and migrates legacy snake_case keys if found.
     """
@@ -290,8 +338,6 @@ def needs_track_sync(
             - tracks_to_find: List of track IDs that need to be found in API response
     """
     try:
-        # Get tracks from database with their snapshot_ids
-        db_tracks = get_playlist_tracks_with_snapshot_from_db(playlist_spotify_id)
         db_total_tracks = get_playlist_total_tracks_from_db(playlist_spotify_id)
 
         # Check if total count matches
@@ -306,11 +352,11 @@ def needs_track_sync(
             # - Removed tracks (DB=1345, API=1000)
             return True, []  # Empty list indicates full sync needed
 
-        # Check if any tracks have different snapshot_id
-        tracks_to_find = []
-        for track_id, track_data in db_tracks.items():
-            if track_data.get("snapshot_id") != current_snapshot_id:
-                tracks_to_find.append(track_id)
+        # Check if any tracks have different snapshot_id; only those rows are read, so
+        # an unchanged playlist costs one index scan and no per-track Python work
+        tracks_to_find = get_playlist_outdated_track_ids(
+            playlist_spotify_id, current_snapshot_id
+        )
 
         if tracks_to_find:
             logger.info(
@@ -381,7 +427,7 @@ def find_tracks_in_playlist(
                     if track_id in not_found_tracks:
                         found_tracks.append(track_item)
                         not_found_tracks.remove(track_id)
-                        logger.debug(f"Found track {track_id} at offset {offset}")
+                        logger.debug("Found track %s at offset %s", track_id, offset)
 
             offset += len(batch_items)
 
@@ -444,11 +490,13 @@ def check_watched_playlists(specific_playlist_id: str = None):
         playlist_name = playlist_in_db["name"]
         playlist_lock = _get_playlist_lock(playlist_spotify_id)
         logger.debug(
-            f"Playlist Watch Manager: Waiting for lock on playlist {playlist_spotify_id}..."
+            "Playlist Watch Manager: Waiting for lock on playlist %s...",
+            playlist_spotify_id,
         )
         with playlist_lock:
             logger.debug(
-                f"Playlist Watch Manager: Acquired lock for playlist {playlist_spotify_id}."
+                "Playlist Watch Manager: Acquired lock for playlist %s.",
+                playlist_spotify_id,
             )
             logger.info(
                 f"Playlist Watch Manager: Checking playlist '{playlist_name}' ({playlist_spotify_id})..."
@@ -487,7 +535,9 @@ def check_watched_playlists(specific_playlist_id: str = None):
                 else:
                     # Even if playlist snapshot_id hasn't changed, check if individual tracks need sync
                     needs_sync, tracks_to_find = needs_track_sync(
-                        playlist_spotify_id, api_snapshot_id, api_total_tracks
+                        playlist_spotify_id,
+                        api_snapshot_id,
+                        api_total_tracks,
                     )
                     if not needs_sync:
                         logger.info(
@@ -527,24 +577,30 @@ def check_watched_playlists(specific_playlist_id: str = None):
                                 ):
                                     found_tracks.append(item)
                                     remaining_to_find.remove(track["id"])
-                            if found_tracks:
-                                add_tracks_to_playlist_db(
-                                    playlist_spotify_id, found_tracks, api_snapshot_id
-                                )
-                            # Advance offset for next run
+                            # Advance offset for next run; at the end of the scan cycle
+                            # for targeted mode, reset the progress cursor instead
                             next_offset = progress_offset + len(batch_items)
-                            if batch_items and next_offset < api_total_tracks:
+                            more_pages = bool(
+                                batch_items and next_offset < api_total_tracks
+                            )
+                            # Track refresh and progress cursor are committed together
+                            with playlists_write_transaction():
+                                if found_tracks:
+                                    add_tracks_to_playlist_db(
+                                        playlist_spotify_id,
+                                        found_tracks,
+                                        api_snapshot_id,
+                                    )
                                 set_playlist_batch_progress(
-                                    playlist_spotify_id, next_offset, None
+                                    playlist_spotify_id,
+                                    next_offset if more_pages else 0,
+                                    None,
                                 )
+                            if more_pages:
                                 logger.info(
                                     f"Playlist Watch Manager: Targeted sync processed page (offset {progress_offset}, size {len(batch_items)}). Next offset set to {next_offset}."
                                 )
                             else:
-                                # End of scan cycle for targeted mode; reset progress cursor
-                                set_playlist_batch_progress(
-                                    playlist_spotify_id, 0, None
-                                )
                                 logger.info(
                                     "Playlist Watch Manager: Targeted sync reached end of playlist. Resetting scan offset to 0."
                                 )
@@ -578,9 +634,16 @@ def check_watched_playlists(specific_playlist_id: str = None):
                     )
                     batch_items = tracks_batch.get("items", []) if tracks_batch else []
 
-                    # Build quick lookup for new tracks vs DB
-                    db_track_ids = get_playlist_track_ids_from_db(playlist_spotify_id)
-                    queued_for_download_count = 0
+                    # Build quick lookup for new tracks vs DB, limited to this batch
+                    db_track_ids = filter_present_track_ids(
+                        playlist_spotify_id,
+                        (
+                            item["track"]["id"]
+                            for item in batch_items
+                            if item.get("track") and item["track"].get("id")
+                        ),
+                    )
+                    download_payloads = []
                     for item in batch_items:
                         track = item.get("track")
                         if not track or not track.get("id") or track.get("is_local"):
@@ -620,40 +683,55 @@ def check_watched_playlists(specific_playlist_id: str = None):
                                 "custom_dir_format": custom_dir_format,
                                 "custom_track_format": custom_track_format,
                             }
-                            try:
-                                task_id_or_none = download_queue_manager.add_task(
-                                    task_payload, from_watch_job=True
-                                )
-                                if task_id_or_none:
-                                    queued_for_download_count += 1
-                            except Exception as e:
-                                logger.error(
-                                    f"Playlist Watch Manager: Failed to queue download for track {track_id} from playlist '{playlist_name}': {e}",
-                                    exc_info=True,
-                                )
+                            download_payloads.append(task_payload)
 
-                    # Refresh/mark present for items in this batch
-                    if batch_items:
-                        add_tracks_to_playlist_db(
-                            playlist_spotify_id, batch_items, api_snapshot_id
-                        )
+                    # Queue the batch's new tracks together (one task snapshot scan)
+                    if download_payloads:
+                        try:
+                            queued_for_download_count = sum(
+                                1
+                                for task_id_or_none in download_queue_manager.add_tasks(
+                                    download_payloads, from_watch_job=True
+                                )
+                                if task_id_or_none
+                            )
+                            logger.info(
+                                f"Playlist Watch Manager: Queued {queued_for_download_count} of {len(download_payloads)} new tracks from playlist '{playlist_name}'."
+                            )
+                        except Exception as e:
+                            logger.error(
+                                f"Playlist Watch Manager: Failed to queue {len(download_payloads)} new tracks from playlist '{playlist_name}': {e}",
+                                exc_info=True,
+                            )
 
-                    # Advance or finalize progress
+                    # Refresh/mark present for items in this batch and advance or
+                    # finalize progress, all in one transaction
                     next_offset = progress_offset + len(batch_items)
-                    if batch_items and next_offset < api_total_tracks:
-                        set_playlist_batch_progress(
-                            playlist_spotify_id, next_offset, api_snapshot_id
-                        )
+                    batch_finished = not (
+                        batch_items and next_offset < api_total_tracks
+                    )
+                    with playlists_write_transaction():
+                        if batch_items:
+                            add_tracks_to_playlist_db(
+                                playlist_spotify_id, batch_items, api_snapshot_id
+                            )
+                        if not batch_finished:
+                            set_playlist_batch_progress(
+                                playlist_spotify_id, next_offset, api_snapshot_id
+                            )
+                        else:
+                            set_playlist_batch_progress(playlist_spotify_id, 0, None)
+                            update_playlist_snapshot(
+                                playlist_spotify_id, api_snapshot_id, api_total_tracks
+                            )
+
+                    if not batch_finished:
                         logger.info(
                             f"Playlist Watch Manager: Processed batch size {len(batch_items)} at offset {progress_offset}. Next offset {next_offset}."
                         )
                         # Do not update snapshot yet; continue next run
                     else:
                         # Finished this snapshot's full sync
-                        set_playlist_batch_progress(playlist_spotify_id, 0, None)
-                        update_playlist_snapshot(
-                            playlist_spotify_id, api_snapshot_id, api_total_tracks
-                        )
                         logger.info(
                             f"Playlist Watch Manager: Full sync completed for '{playlist_name}'. Snapshot updated to {api_snapshot_id}."
                         )
@@ -672,9 +750,13 @@ def check_watched_playlists(specific_playlist_id: str = None):
                     exc_info=True,
                 )
 
-        # Only sleep between items when running a batch (no specific ID)
-        if not specific_playlist_id:
-            time.sleep(max(1, config.get("delayBetweenPlaylistsSeconds", 2)))
+        # Only sleep between items when running a batch (no specific ID); a stop
+        # request ends the wait and the run immediately
+        if not specific_playlist_id and STOP_EVENT.wait(
+            max(1, config.get("delayBetweenPlaylistsSeconds", 2))
+        ):
+            logger.info("Playlist Watch Manager: Stop requested, ending check early.")
+            return
 
     logger.info("Playlist Watch Manager: Finished checking all watched playlists.")
 
@@ -717,11 +799,11 @@ def check_watched_artists(specific_artist_id: str = None):
         artist_name = artist_in_db["name"]
         artist_lock = _get_artist_lock(artist_spotify_id)
         logger.debug(
-            f"Artist Watch Manager: Waiting for lock on artist {artist_spotify_id}..."
+            "Artist Watch Manager: Waiting for lock on artist %s...", artist_spotify_id
         )
         with artist_lock:
             logger.debug(
-                f"Artist Watch Manager: Acquired lock for artist {artist_spotify_id}."
+                "Artist Watch Manager: Acquired lock for artist %s.", artist_spotify_id
             )
             logger.info(
                 f"Artist Watch Manager: Checking artist '{artist_name}' ({artist_spotify_id})..."
@@ -732,7 +814,10 @@ def check_watched_artists(specific_artist_id: str = None):
                 offset = get_artist_batch_next_offset(artist_spotify_id)
                 limit = artist_batch_limit
                 logger.debug(
-                    f"Artist Watch Manager: Fetching albums for {artist_spotify_id}. Limit: {limit}, Offset: {offset}"
+                    "Artist Watch Manager: Fetching albums for %s. Limit: %s, Offset: %s",
+                    artist_spotify_id,
+                    limit,
+                    offset,
                 )
                 artist_albums_page = get_spotify_info(
                     artist_spotify_id, "artist_discography", limit=limit, offset=offset
@@ -748,8 +833,12 @@ def check_watched_artists(specific_artist_id: str = None):
                     artist_albums_page.get("total", 0) if artist_albums_page else 0
                 )
 
-                db_album_ids = get_artist_album_ids_from_db(artist_spotify_id)
-                queued_for_download_count = 0
+                # Look up only this page's albums, not every stored album of the artist
+                missing_album_ids = filter_missing_albums(
+                    artist_spotify_id,
+                    (album_data.get("id") for album_data in current_page_albums),
+                )
+                download_payloads = []
                 processed_album_ids_in_run = set()
 
                 for album_data in current_page_albums:
@@ -764,7 +853,7 @@ def check_watched_artists(specific_artist_id: str = None):
                     if album_group not in watched_album_groups:
                         continue
 
-                    if album_id not in db_album_ids:
+                    if album_id in missing_album_ids:
                         album_name = album_data.get("name", "Unknown Album")
                         album_artists_list = album_data.get("artists", [])
                         album_main_artist_name = (
@@ -785,17 +874,26 @@ def check_watched_artists(specific_artist_id: str = None):
                                 "album_data_for_db": album_data,
                             },
                         }
-                        try:
-                            task_id_or_none = download_queue_manager.add_task(
-                                task_payload, from_watch_job=True
-                            )
-                            if task_id_or_none:
-                                queued_for_download_count += 1
-                        except Exception as e:
-                            logger.error(
-                                f"Artist Watch Manager: Failed to queue download for new album {album_id} ('{album_name}') from artist '{artist_name}': {e}",
-                                exc_info=True,
+                        download_payloads.append(task_payload)
+
+                # Queue the page's new albums together (one task snapshot scan)
+                if download_payloads:
+                    try:
+                        queued_for_download_count = sum(
+                            1
+                            for task_id_or_none in download_queue_manager.add_tasks(
+                                download_payloads, from_watch_job=True
                             )
+                            if task_id_or_none
+                        )
+                        logger.info(
+                            f"Artist Watch Manager: Queued {queued_for_download_count} of {len(download_payloads)} new albums from artist '{artist_name}'."
+                        )
+                    except Exception as e:
+                        logger.error(
+                            f"Artist Watch Manager: Failed to queue {len(download_payloads)} new albums from artist '{artist_name}': {e}",
+                            exc_info=True,
+                        )
 
                 # Advance offset or finalize
                 if artist_albums_page and artist_albums_page.get("next"):
@@ -805,10 +903,11 @@ def check_watched_artists(specific_artist_id: str = None):
                         f"Artist Watch Manager: Processed page size {len(current_page_albums)} at offset {offset}. Next offset {next_offset}."
                     )
                 else:
-                    set_artist_batch_next_offset(artist_spotify_id, 0)
-                    update_artist_metadata_after_check(
-                        artist_spotify_id, api_reported_total_albums
-                    )
+                    with artists_write_transaction():
+                        set_artist_batch_next_offset(artist_spotify_id, 0)
+                        update_artist_metadata_after_check(
+                            artist_spotify_id, api_reported_total_albums
+                        )
                     logger.info(
                         f"Artist Watch Manager: Completed discography scan for '{artist_name}'. Metadata updated."
                     )
@@ -819,9 +918,13 @@ def check_watched_artists(specific_artist_id: str = None):
                     exc_info=True,
                 )
 
-        # Only sleep between items when running a batch (no specific ID)
-        if not specific_artist_id:
-            time.sleep(max(1, config.get("delayBetweenArtistsSeconds", 5)))
+        # Only sleep between items when running a batch (no specific ID); a stop
+        # request ends the wait and the run immediately
+        if not specific_artist_id and STOP_EVENT.wait(
+            max(1, config.get("delayBetweenArtistsSeconds", 5))
+        ):
+            logger.info("Artist Watch Manager: Stop requested, ending check early.")
+            return
 
     logger.info("Artist Watch Manager: Finished checking all watched artists.")
 
@@ -829,7 +932,7 @@ def check_watched_artists(specific_artist_id: str = None):
 def playlist_watch_scheduler():
     """Periodically checks one watched item (playlist or artist) per interval in round-robin order."""
     logger.info("Watch Scheduler: Thread started.")
-    global _round_robin_index
+    global _round_robin_index, _last_db_optimize
 
     while not STOP_EVENT.is_set():
         current_config = get_watch_config()  # Get latest config for this run
@@ -847,10 +950,13 @@ def playlist_watch_scheduler():
 
         # Build the current list of items to watch (playlists and artists)
         try:
-            playlists_list = get_watched_playlists() or []
-            recorded_playlists = [("playlist", p["spotify_id"]) for p in playlists_list]
-            artists_list = get_watched_artists() or []
-            recorded_artists = [("artist", a["spotify_id"]) for a in artists_list]
+            # Only the IDs are needed here; skip materializing full rows every poll
+            recorded_playlists = [
+                ("playlist", playlist_id) for playlist_id in get_watched_playlist_ids()
+            ]
+            recorded_artists = [
+                ("artist", artist_id) for artist_id in get_watched_artist_ids()
+            ]
             all_items = recorded_playlists + recorded_artists
         except Exception as e:
             logger.error(
@@ -891,6 +997,10 @@ def playlist_watch_scheduler():
                 exc_info=True,
             )
 
+        if time.monotonic() - _last_db_optimize >= DB_OPTIMIZE_INTERVAL_SECONDS:
+            optimize_watch_databases()
+            _last_db_optimize = time.monotonic()
+
         logger.info(
             f"Watch Scheduler: One-item check complete. Next run in {interval} seconds."
         )
@@ -1009,45 +1119,28 @@ def get_playlist_tracks_for_m3u(playlist_spotify_id: str) -> List[Dict[str, Any]
     Returns:
             List of track dictionaries with metadata
     """
-    table_name = f"playlist_{playlist_spotify_id.replace('-', '_')}"
     tracks: List[Dict[str, Any]] = []
 
     try:
         from routes.utils.watch.db import (
-            _get_playlists_db_connection,
-            _ensure_table_schema,
-            EXPECTED_PLAYLIST_TRACKS_COLUMNS,
+            _playlists_read_connection,
+            PLAYLIST_TRACKS_TABLE,
         )
 
-        with _get_playlists_db_connection() as conn:
+        with _playlists_read_connection() as conn:
             cursor = conn.cursor()
 
-            # Check if table exists
-            cursor.execute(
-                f"SELECT name FROM sqlite_master WHERE type='table' AND name='{table_name}';"
-            )
-            if cursor.fetchone() is None:
-                logger.warning(
-                    f"Track table {table_name} does not exist. Cannot generate m3u file."
-                )
-                return tracks
-
-            # Ensure the table has the latest schema before querying
-            _ensure_table_schema(
-                cursor,
-                table_name,
-                EXPECTED_PLAYLIST_TRACKS_COLUMNS,
-                f"playlist tracks ({playlist_spotify_id})",
-            )
-
             # Get all tracks that are present in Spotify
-            cursor.execute(f"""
+            cursor.execute(
+                f"""
 				SELECT spotify_track_id, title, artist_names, album_name,
 				       album_artist_names, track_number, duration_ms, final_path
-				FROM {table_name}
-				WHERE is_present_in_spotify = 1
+				FROM {PLAYLIST_TRACKS_TABLE}
+				WHERE playlist_spotify_id = ? AND is_present_in_spotify = 1
 				ORDER BY track_number, title
-			""")
+			""",
+                (playlist_spotify_id,),
+            )
 
             rows = cursor.fetchall()
             for row in rows:
@@ -0,0 +1,116 @@
+import os
+import unittest
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import mock
+
+import pytest
+
+
+# Override the autouse credentials fixture from conftest for this module
+@pytest.fixture(scope="session", autouse=True)
+def setup_credentials_for_tests():
+    # No-op to avoid external API calls; this shadows the session autouse fixture in conftest.py
+    yield
+
+
+CONFIG_PARAMS = {
+    "deezer": "",
+    "spotify": "",
+    "fallback": False,
+    "deezerQuality": "MP3_128",
+    "spotifyQuality": "NORMAL",
+    "realTime": False,
+    "customDirFormat": "%ar_album%/%album%",
+    "customTrackFormat": "%tracknum%. %music%",
+    "tracknumPadding": True,
+    "saveCover": True,
+}
+
+
+class TestAddTasksBatch(unittest.TestCase):
+    """
+    Queues watch-job batches through add_tasks with Redis and Celery replaced by recorders.
+    """
+
+    def setUp(self):
+        self.temp_dir = Path(mkdtemp())
+        self.original_cwd = os.getcwd()
+        # Importing the queue manager creates ./data/config and the history DB
+        os.chdir(self.temp_dir)
+        from routes.utils import celery_queue_manager
+
+        self.qm = celery_queue_manager
+        self.statuses = {}
+        self.existing_tasks = [
+            {
+                "task_id": "existing",
+                "task_info": {
+                    "url": "https://open.spotify.com/track/t0",
+                    "download_type": "track",
+                },
+                "last_status": {"status": "downloading"},
+            }
+        ]
+        self.get_all_tasks = mock.Mock(return_value=self.existing_tasks)
+        self.download_track = mock.Mock()
+        patches = [
+            mock.patch.object(self.qm, "get_all_tasks", self.get_all_tasks),
+            mock.patch.object(
+                self.qm, "get_config_params", return_value=dict(CONFIG_PARAMS)
+            ),
+            mock.patch.object(self.qm, "store_task_info"),
+            mock.patch.object(
+                self.qm, "store_task_status", side_effect=self.statuses.__setitem__
+            ),
+            mock.patch.object(self.qm, "download_track", self.download_track),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.manager = self.qm.CeleryDownloadQueueManager()
+
+    def tearDown(self):
+        os.chdir(self.original_cwd)
+        rmtree(self.temp_dir)
+
+    def _task(self, track_id: str) -> dict:
+        return {
+            "download_type": "track",
+            "url": f"https://open.spotify.com/track/{track_id}",
+            "name": track_id,
+        }
+
+    def test_batch_reads_task_snapshot_once_and_skips_duplicates(self):
+        results = self.manager.add_tasks(
+            [self._task("t1"), self._task("t0"), self._task("t2"), self._task("t1")],
+            from_watch_job=True,
+        )
+
+        self.get_all_tasks.assert_called_once()
+        self.assertIsNotNone(results[0])
+        self.assertIsNone(results[1])  # active before the batch
+        self.assertIsNotNone(results[2])
+        self.assertIsNone(results[3])  # queued earlier in the same batch
+        self.assertEqual(self.download_track.apply_async.call_count, 2)
+
+    def test_queue_positions_follow_the_batch_order(self):
+        results = self.manager.add_tasks(
+            [self._task("t1"), self._task("t2"), self._task("t3")],
+            from_watch_job=True,
+        )
+
+        self.assertEqual(
+            [self.statuses[task_id]["queue_position"] for task_id in results],
+            [2, 3, 4],
+        )
+
+    def test_add_task_matches_single_item_batch(self):
+        task_id = self.manager.add_task(self._task("t1"))
+
+        self.assertEqual(self.statuses[task_id]["queue_position"], 2)
+        self.download_track.apply_async.assert_called_once()
+        self.assertEqual(
+            self.download_track.apply_async.call_args.kwargs["task_id"], task_id
+        )
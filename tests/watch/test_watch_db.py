@@ -0,0 +1,220 @@
+import os
+import sqlite3
+import unittest
+from pathlib import Path
+from shutil import rmtree
+from tempfile import mkdtemp
+from unittest import mock
+
+import pytest
+
+PLAYLIST_ID = "37i9dQZF1DX-cBWIGo"
+ARTIST_ID = "7l6cdPhOLYO7lehz5xfzLV"
+
+
+# Override the autouse credentials fixture from conftest for this module
+@pytest.fixture(scope="session", autouse=True)
+def setup_credentials_for_tests():
+    # No-op to avoid external API calls; this shadows the session autouse fixture in conftest.py
+    yield
+
+
+def _track(track_id: str, title: str) -> dict:
+    return {
+        "id": track_id,
+        "name": title,
+        "artists": [{"name": "Artist"}],
+        "album": {"id": f"album_{track_id}", "name": "Album", "artists": []},
+        "track_number": 1,
+        "duration_ms": 1000,
+    }
+
+
+class TestWatchDb(unittest.TestCase):
+    """
+    Runs the watch DB helpers against pools opened on temporary playlists/artists databases.
+    """
+
+    def setUp(self):
+        self.temp_dir = Path(mkdtemp())
+        self.original_cwd = os.getcwd()
+        # Importing the module initializes ./data/watch; keep that out of the working tree
+        os.chdir(self.temp_dir)
+        from routes.utils.watch import db
+
+        self.db = db
+        self.playlists_db_path = self.temp_dir / "watch" / "playlists.db"
+        self.artists_db_path = self.temp_dir / "watch" / "artists.db"
+        self.original_pools = (db._playlists_pool, db._artists_pool)
+        db._playlists_pool = db.SqlitePool(self.playlists_db_path)
+        db._artists_pool = db.SqlitePool(self.artists_db_path)
+        db._watched_artists_cache.clear()
+
+    def tearDown(self):
+        self.db._playlists_pool.close()
+        self.db._artists_pool.close()
+        self.db._playlists_pool, self.db._artists_pool = self.original_pools
+        self.db._watched_artists_cache.clear()
+        os.chdir(self.original_cwd)
+        rmtree(self.temp_dir)
+
+    def _table_names(self, db_path: Path) -> set:
+        with sqlite3.connect(db_path) as conn:
+            cursor = conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            return {row[0] for row in cursor.fetchall()}
+
+    def _add_watched_playlist(self):
+        self.db.add_playlist_to_watch(
+            {
+                "id": PLAYLIST_ID,
+                "name": "Playlist",
+                "owner": {"id": "owner"},
+                "tracks": {"total": 2},
+                "snapshot_id": "snap1",
+            }
+        )
+
+    def test_legacy_playlist_table_is_folded_into_playlist_tracks(self):
+        """A 3.x playlist_<id> table is copied into playlist_tracks and dropped."""
+        self.playlists_db_path.parent.mkdir(parents=True, exist_ok=True)
+        legacy_table = f"playlist_{PLAYLIST_ID.replace('-', '_')}"
+        with sqlite3.connect(self.playlists_db_path) as conn:
+            conn.executescript(
+                f"""
+                CREATE TABLE watched_playlists (spotify_id TEXT PRIMARY KEY, name TEXT);
+                INSERT INTO watched_playlists (spotify_id, name) VALUES ('{PLAYLIST_ID}', 'Playlist');
+                CREATE TABLE {legacy_table} (
+                    spotify_track_id TEXT PRIMARY KEY, title TEXT, artist_names TEXT,
+                    album_name TEXT, album_artist_names TEXT, track_number INTEGER,
+                    album_spotify_id TEXT, duration_ms INTEGER, added_at_playlist TEXT,
+                    added_to_db INTEGER, is_present_in_spotify INTEGER DEFAULT 1,
+                    last_seen_in_spotify INTEGER, snapshot_id TEXT
+                );
+                INSERT INTO {legacy_table} (spotify_track_id, title, snapshot_id)
+                VALUES ('t1', 'One', 'snap1'), ('t2', 'Two', 'snap1');
+                """
+            )
+
+        self.db.init_playlists_db()
+
+        tables = self._table_names(self.playlists_db_path)
+        self.assertNotIn(legacy_table, tables)
+        self.assertIn(self.db.PLAYLIST_TRACKS_TABLE, tables)
+        self.assertEqual(
+            self.db.get_playlist_track_ids_from_db(PLAYLIST_ID), {"t1", "t2"}
+        )
+        self.assertEqual(
+            self.db.get_playlist_outdated_track_ids(PLAYLIST_ID, "snap1"), []
+        )
+        self.assertEqual(
+            sorted(self.db.get_playlist_outdated_track_ids(PLAYLIST_ID, "snap2")),
+            ["t1", "t2"],
+        )
+
+    def test_present_tracks_index_with_old_columns_is_rebuilt(self):
+        index_name = f"idx_{self.db.PLAYLIST_TRACKS_TABLE}_present"
+        self.db.init_playlists_db()
+        with self.db.playlists_write_transaction() as conn:
+            conn.execute(f"DROP INDEX {index_name}")
+            conn.execute(
+                f"CREATE INDEX {index_name} ON {self.db.PLAYLIST_TRACKS_TABLE}"
+                "(playlist_spotify_id, is_present_in_spotify, spotify_track_id, snapshot_id, title)"
+            )
+
+        self.db.init_playlists_db()
+
+        with sqlite3.connect(self.playlists_db_path) as conn:
+            cursor = conn.execute(f"PRAGMA index_info({index_name})")
+            columns = [row[2] for row in cursor.fetchall()]
+        self.assertEqual(
+            columns, ["playlist_spotify_id", "is_present_in_spotify", "snapshot_id"]
+        )
+
+    def test_legacy_artist_table_is_folded_into_artist_albums(self):
+        """A 3.x artist_<id> table is copied into artist_albums and dropped."""
+        self.artists_db_path.parent.mkdir(parents=True, exist_ok=True)
+        legacy_table = f"artist_{ARTIST_ID}"
+        with sqlite3.connect(self.artists_db_path) as conn:
+            conn.executescript(
+                f"""
+                CREATE TABLE watched_artists (spotify_id TEXT PRIMARY KEY, name TEXT);
+                INSERT INTO watched_artists (spotify_id, name) VALUES ('{ARTIST_ID}', 'Artist');
+                CREATE TABLE {legacy_table} (
+                    album_spotify_id TEXT PRIMARY KEY, artist_spotify_id TEXT, name TEXT,
+                    album_group TEXT, album_type TEXT, release_date TEXT,
+                    total_tracks INTEGER, download_status INTEGER DEFAULT 0
+                );
+                INSERT INTO {legacy_table} (album_spotify_id, artist_spotify_id, name, download_status)
+                VALUES ('al1', '{ARTIST_ID}', 'First', 2), ('al2', '{ARTIST_ID}', 'Second', 0);
+                """
+            )
+
+        self.db.init_artists_db()
+
+        tables = self._table_names(self.artists_db_path)
+        self.assertNotIn(legacy_table, tables)
+        self.assertEqual(
+            set(self.db.get_artist_album_ids_from_db(ARTIST_ID)), {"al1", "al2"}
+        )
+        self.assertTrue(self.db.is_album_in_artist_db(ARTIST_ID, "al1"))
+        self.assertFalse(self.db.is_album_in_artist_db(ARTIST_ID, "al3"))
+
+    def test_nested_write_transaction_rolls_back_as_a_whole(self):
+        """Helpers called inside playlists_write_transaction join it and roll back with it."""
+        self.db.init_playlists_db()
+        self._add_watched_playlist()
+
+        with self.assertRaises(RuntimeError):
+            with self.db.playlists_write_transaction():
+                self.db.add_specific_tracks_to_playlist_table(
+                    PLAYLIST_ID, [_track("t1", "One")]
+                )
+                self.db.set_playlist_batch_progress(PLAYLIST_ID, 50, "snap2")
+                raise RuntimeError("abort batch")
+
+        self.assertEqual(self.db.get_playlist_track_ids_from_db(PLAYLIST_ID), set())
+        self.assertEqual(self.db.get_playlist_batch_progress(PLAYLIST_ID), (0, None))
+
+        with self.db.playlists_write_transaction():
+            self.db.add_specific_tracks_to_playlist_table(
+                PLAYLIST_ID, [_track("t1", "One")]
+            )
+            self.db.set_playlist_batch_progress(PLAYLIST_ID, 50, "snap2")
+
+        self.assertEqual(self.db.get_playlist_track_ids_from_db(PLAYLIST_ID), {"t1"})
+        self.assertEqual(
+            self.db.get_playlist_batch_progress(PLAYLIST_ID), (50, "snap2")
+        )
+
+    def test_reader_is_read_only_and_sees_committed_rows_only(self):
+        self.db.init_playlists_db()
+        pool = self.db._playlists_pool
+
+        with pool.write():
+            self._add_watched_playlist()
+            with pool.read() as reader:
+                count = reader.execute(
+                    "SELECT COUNT(*) AS n FROM watched_playlists"
+                ).fetchone()
+            self.assertEqual(count, {"n": 0})
+
+        self.assertEqual(self.db.get_watched_playlist_ids(), [PLAYLIST_ID])
+
+        with pool.read() as reader:
+            with self.assertRaises(sqlite3.OperationalError):
+                reader.execute("DELETE FROM watched_playlists")
+            reader.rollback()
+
+    def test_connections_are_reopened_after_fork(self):
+        pool = self.db._playlists_pool
+        with pool.write() as writer, pool.read() as reader:
+            pass
+
+        with mock.patch.object(self.db.os, "getpid", return_value=os.getpid() + 1):
+            with pool.write() as child_writer, pool.read() as child_reader:
+                pass
+
+        self.assertIsNot(child_writer, writer)
+        self.assertIsNot(child_reader, reader)
+        child_writer.close()
+        child_reader.close()